@@ -24,36 +24,8 @@ except ImportError:
     print("Error: gensim package not found")
     sys.exit(1)
 
-# %%
-def load_fasttext_model(model_dir: Path) -> KeyedVectors:
-    """
-    Load FastText model from the specified directory.
-
-    Args:
-        model_dir: Path to directory containing .vec model file
-
-    Returns:
-        Loaded FastText model as KeyedVectors
-
-    Raises:
-        FileNotFoundError: If no .vec file found in directory
-    """
-    vec_files = list(model_dir.glob("*.vec"))
-
-    if not vec_files:
-        raise FileNotFoundError(
-            f"No .vec model file found in {model_dir}. "
-            "Please download a FastText model first."
-        )
-
-    model_path = vec_files[0]
-    print(f"Loading FastText model from: {model_path}")
-
-    model = KeyedVectors.load_word2vec_format(str(model_path))
-    print(f"Model loaded successfully!")
-    print(f"Model vocabulary size: {len(model)}")
-
-    return model
+# Shared loader with the memory-mapped .kv cache, next to this script
+from fasttext_model import load_fasttext_model
 
 # %%
 def test_embeddings(model: KeyedVectors, words: list[str]) -> None:
@@ -1,20 +1,19 @@
 #!/usr/bin/env -S uv run --isolated --no-project --script
 # %%
 # /// script
-# dependencies = ["gensim>=4.0.0", "numpy", "pandas"]
+# dependencies = ["gensim>=4.0.0", "numpy", "pandas", "pyarrow"]
 # ///
 
 """
-Generate FastText embeddings for a list of words and save to CSV.
+Generate FastText embeddings for a list of words and save them to disk.
 
 This script reads words from a text file (one per line), generates embeddings
-using a pre-trained FastText model, and saves the results to a CSV file with
-word and embedding columns.
+using a pre-trained FastText model, and saves the words to a CSV file with
+word and row columns plus the embedding matrix to a .npy file alongside it.
 """
 
 # %%
 import sys
-import json
 import argparse
 from pathlib import Path
 from typing import List, Tuple
@@ -28,37 +27,18 @@ except ImportError:
     print("Error: gensim package not found")
     sys.exit(1)
 
-# %%
-def load_fasttext_model(model_dir: Path) -> KeyedVectors:
-    """
-    Load FastText model from the specified directory.
-
-    Args:
-        model_dir: Path to directory containing .vec model file
-
-    Returns:
-        Loaded FastText model as KeyedVectors
+# Shared loader with the memory-mapped .kv cache, next to this script
+from fasttext_model import load_fasttext_model
 
-    Raises:
-        FileNotFoundError: If no .vec file found in directory
-    """
-    vec_files = list(model_dir.glob("*.vec"))
-
-    if not vec_files:
-        raise FileNotFoundError(
-            f"No .vec model file found in {model_dir}. "
-            "Please download a FastText model first."
-        )
-
-    model_path = vec_files[0]
-    print(f"Loading FastText model from: {model_path}")
-
-    model = KeyedVectors.load_word2vec_format(str(model_path))
-    print(f"Model loaded successfully!")
-    print(f"Model vocabulary size: {len(model)}")
-    print()
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
-    return model
+# Rows per Parquet row group when writing .parquet output
+PARQUET_CHUNK_SIZE = 50_000
 
 # %%
 def read_words(input_file: Path) -> List[str]:
@@ -77,8 +57,9 @@ def read_words(input_file: Path) -> List[str]:
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        words = [line.strip() for line in f if line.strip()]
+    # One read and one C-level split instead of iterating the file line by line
+    lines = input_file.read_text(encoding='utf-8').splitlines()
+    words = [word for word in map(str.strip, lines) if word]
 
     print(f"Read {len(words)} words from {input_file}")
     return words
@@ -87,64 +68,138 @@ def read_words(input_file: Path) -> List[str]:
 def generate_embeddings(
     model: KeyedVectors,
     words: List[str]
-) -> List[Tuple[str, np.ndarray]]:
+) -> Tuple[List[str], np.ndarray]:
     """
-    Generate embeddings for a list of words with progress indication.
+    Generate embeddings for a list of words in one batched gather.
 
     Args:
         model: Loaded FastText model
         words: List of words to embed
 
     Returns:
-        List of (word, embedding) tuples
-    """
-    embeddings = []
-    total = len(words)
+        Tuple of (words, embeddings_matrix)
 
-    print(f"Generating embeddings for {total} words...")
-
-    for i, word in enumerate(words, 1):
-        embedding = model[word]
-        embeddings.append((word, embedding))
-
-        # Progress indication
-        if i % 100 == 0 or i == total:
-            print(f"  Progress: {i}/{total} ({100*i/total:.1f}%)")
+    Raises:
+        KeyError: If a word is not in the model vocabulary
+    """
+    print(f"Generating embeddings for {len(words)} words...")
+
+    # Resolve all keys up front and gather the rows in a single take()
+    key_to_index = model.key_to_index
+    indices = np.fromiter(
+        (key_to_index[word] for word in words),
+        dtype=np.int64,
+        count=len(words)
+    )
+    embeddings_matrix = model.vectors.take(indices, axis=0)
 
-    print(f"Generated {len(embeddings)} embeddings")
-    print(f"Embedding dimension: {len(embeddings[0][1])}")
+    print(f"Generated {embeddings_matrix.shape[0]} embeddings")
+    print(f"Embedding dimension: {embeddings_matrix.shape[1]}")
     print()
 
-    return embeddings
+    return words, embeddings_matrix
 
 # %%
 def save_embeddings(
-    embeddings: List[Tuple[str, np.ndarray]],
+    words: List[str],
+    embeddings: np.ndarray,
     output_file: Path
 ) -> None:
     """
-    Save embeddings to CSV file.
+    Save words to a CSV file and the embedding matrix to a .npy sidecar.
+
+    The CSV holds one row per word with the index of its row in the matrix;
+    the matrix is written as raw float32 so it can be read back with
+    np.load(..., mmap_mode='r') without any text parsing. If output_file
+    ends in .parquet, a single Parquet file is written instead.
 
     Args:
-        embeddings: List of (word, embedding) tuples
-        output_file: Path to output CSV file
+        words: List of words, one per embedding row
+        embeddings: Embeddings matrix of shape (len(words), dim)
+        output_file: Path to output CSV file (matrix goes to the .npy sibling)
     """
-    # Convert embeddings to JSON arrays for CSV storage
-    data = {
-        'word': [word for word, _ in embeddings],
-        'embedding': [json.dumps(emb.tolist()) for _, emb in embeddings]
-    }
+    if output_file.suffix == '.parquet':
+        save_embeddings_parquet(words, embeddings, output_file)
+        return
 
-    df = pd.DataFrame(data)
+    matrix_file = output_file.with_suffix('.npy')
+
+    df = pd.DataFrame({
+        'word': words,
+        'row': np.arange(len(words)),
+    })
 
     # Create output directory if needed
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    np.save(matrix_file, np.ascontiguousarray(embeddings, dtype=np.float32))
     df.to_csv(output_file, index=False)
-    print(f"Saved embeddings to: {output_file}")
+
+    print(f"Saved words to: {output_file}")
     print(f"  Rows: {len(df)}")
     print(f"  Columns: {list(df.columns)}")
     print(f"  File size: {output_file.stat().st_size / 1024:.2f} KB")
+    print(f"Saved embedding matrix to: {matrix_file}")
+    print(f"  Shape: {embeddings.shape}")
+    print(f"  File size: {matrix_file.stat().st_size / 1024:.2f} KB")
+
+# %%
+def save_embeddings_parquet(
+    words: List[str],
+    embeddings: np.ndarray,
+    output_file: Path,
+    chunk_size: int = PARQUET_CHUNK_SIZE
+) -> None:
+    """
+    Save words and embeddings to a zstd-compressed Parquet file.
+
+    Rows are written in chunks of chunk_size, each becoming one row group,
+    so only one chunk is converted to Arrow at a time. Embeddings are
+    stored as a fixed-size list of float32 values.
+
+    Args:
+        words: List of words, one per embedding row
+        embeddings: Embeddings matrix of shape (len(words), dim)
+        output_file: Path to output Parquet file
+        chunk_size: Number of rows per row group
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if pa is None:
+        raise ImportError("Parquet output requires the pyarrow package")
+
+    dim = embeddings.shape[1]
+    schema = pa.schema([
+        ('word', pa.string()),
+        ('embedding', pa.list_(pa.float32(), dim)),
+    ])
+
+    # Create output directory if needed
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with pq.ParquetWriter(
+        output_file,
+        schema,
+        compression='zstd',
+        compression_level=3
+    ) as writer:
+        for start in range(0, len(words), chunk_size):
+            stop = start + chunk_size
+            values = np.ascontiguousarray(embeddings[start:stop], dtype=np.float32)
+            table = pa.Table.from_arrays(
+                [
+                    pa.array(words[start:stop], type=pa.string()),
+                    pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), dim),
+                ],
+                schema=schema
+            )
+            writer.write_table(table)
+
+    print(f"Saved embeddings to: {output_file}")
+    print(f"  Rows: {len(words)}")
+    print(f"  Columns: {schema.names}")
+    print(f"  File size: {output_file.stat().st_size / 1024:.2f} KB")
 
 # %%
 def parse_args() -> argparse.Namespace:
@@ -167,7 +222,7 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         dest='output_file',
         default=Path('embeddings.csv'),
-        help="Output CSV file for embeddings"
+        help="Output file: .csv for words plus a .npy matrix sidecar, or .parquet for a single file"
     )
 
     parser.add_argument(
@@ -178,6 +233,13 @@ def parse_args() -> argparse.Namespace:
         help="Directory containing FastText .vec model (default: data/fasttext/)"
     )
 
+    parser.add_argument(
+        '--no-model-cache',
+        action='store_false',
+        dest='use_model_cache',
+        help="Always parse the .vec file instead of using the memory-mapped .kv cache"
+    )
+
     return parser.parse_args()
 
 # %%
@@ -203,16 +265,17 @@ def main():
 
     try:
         # Load model
-        model = load_fasttext_model(model_dir)
+        model = load_fasttext_model(model_dir, args.use_model_cache)
+        print()
 
         # Read words
         words = read_words(args.input_file)
 
         # Generate embeddings
-        embeddings = generate_embeddings(model, words)
+        words, embeddings = generate_embeddings(model, words)
 
-        # Save to CSV
-        save_embeddings(embeddings, args.output_file)
+        # Save words CSV and embedding matrix
+        save_embeddings(words, embeddings, args.output_file)
 
         print(f"\n{'='*60}")
         print("Embedding generation completed successfully!")
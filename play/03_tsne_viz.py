@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --isolated --no-project --script
 # %%
 # /// script
-# dependencies = ["gensim>=4.0.0", "numpy", "scikit-learn", "matplotlib", "pandas"]
+# dependencies = ["gensim>=4.0.0", "numpy", "scikit-learn", "matplotlib", "pandas", "openTSNE"]
 # ///
 
 """
@@ -15,14 +15,17 @@ scatter plot visualization with word labels.
 # %%
 import sys
 import argparse
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import matplotlib.transforms as mtransforms
 from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors
 
 try:
     from gensim.models import KeyedVectors
@@ -30,37 +33,19 @@ except ImportError:
     print("Error: gensim package not found")
     sys.exit(1)
 
-# %%
-def load_fasttext_model(model_dir: Path) -> KeyedVectors:
-    """
-    Load FastText model from the specified directory.
-
-    Args:
-        model_dir: Path to directory containing .vec model file
-
-    Returns:
-        Loaded FastText model as KeyedVectors
-
-    Raises:
-        FileNotFoundError: If no .vec file found in directory
-    """
-    vec_files = list(model_dir.glob("*.vec"))
+# Shared loader with the memory-mapped .kv cache, next to this script
+from fasttext_model import load_fasttext_model
 
-    if not vec_files:
-        raise FileNotFoundError(
-            f"No .vec model file found in {model_dir}. "
-            "Please download a FastText model first."
-        )
-
-    model_path = vec_files[0]
-    print(f"Loading FastText model from: {model_path}")
-
-    model = KeyedVectors.load_word2vec_format(str(model_path))
-    print(f"Model loaded successfully!")
-    print(f"Model vocabulary size: {len(model)}")
-    print()
+# Optional faster t-SNE backends; sklearn is used when neither is installed
+try:
+    from cuml.manifold import TSNE as CumlTSNE
+except ImportError:
+    CumlTSNE = None
 
-    return model
+try:
+    from openTSNE import TSNE as OpenTSNE
+except ImportError:
+    OpenTSNE = None
 
 # %%
 def read_words(input_file: Path, line_limit: int) -> List[str]:
@@ -80,14 +65,14 @@ def read_words(input_file: Path, line_limit: int) -> List[str]:
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    words = []
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for i, line in enumerate(f):
-            if line_limit > 0 and i >= line_limit:
-                break
-            word = line.strip()
-            if word:
-                words.append(word)
+    if line_limit > 0:
+        # Only pull the lines we need instead of reading the whole file
+        with open(input_file, 'r', encoding='utf-8') as f:
+            lines = list(islice(f, line_limit))
+    else:
+        lines = input_file.read_text(encoding='utf-8').splitlines()
+
+    words = [word for word in map(str.strip, lines) if word]
 
     print(f"Read {len(words)} words from {input_file}")
     if line_limit > 0:
@@ -113,12 +98,16 @@ def generate_embeddings(
     """
     print(f"Generating embeddings for {len(words)} words...")
 
-    embeddings = []
-    for word in words:
-        embedding = model[word]
-        embeddings.append(embedding)
-
-    embeddings_matrix = np.array(embeddings)
+    # Resolve all keys up front and gather the rows in a single take()
+    # straight into one preallocated float32 matrix
+    key_to_index = model.key_to_index
+    indices = np.fromiter(
+        (key_to_index[word] for word in words),
+        dtype=np.int64,
+        count=len(words)
+    )
+    embeddings_matrix = np.empty((len(words), model.vector_size), dtype=np.float32)
+    np.take(model.vectors, indices, axis=0, out=embeddings_matrix)
 
     print(f"Generated embeddings matrix:")
     print(f"  Shape: {embeddings_matrix.shape}")
@@ -144,24 +133,85 @@ def reduce_dimensions(embeddings: np.ndarray, n_components: int = 8) -> np.ndarr
     print(f"  Original dimensions: {embeddings.shape[1]}")
     print(f"  Target dimensions: {n_components}")
 
-    pca = PCA(n_components=n_components)
-    reduced = pca.fit_transform(embeddings)
+    # Randomized SVD only computes the leading components, and keeping the
+    # input float32 halves the memory traffic of the decomposition
+    pca = PCA(n_components=n_components, svd_solver='randomized', random_state=0)
+    reduced = pca.fit_transform(embeddings.astype(np.float32, copy=False))
 
     variance_explained = pca.explained_variance_ratio_.sum()
     print(f"  Reduced dimensions: {reduced.shape[1]}")
     print(f"  Variance explained: {variance_explained:.2%}")
     print()
 
-    return reduced
+    return np.ascontiguousarray(reduced, dtype=np.float32)
+
+# %%
+def pca_initialization(embeddings_pca: np.ndarray) -> np.ndarray:
+    """
+    Build a t-SNE initialization from an existing PCA projection.
+
+    PCA components are ordered by explained variance, so the first two
+    columns of the PCA output already are the 2D PCA projection. They are
+    rescaled to a standard deviation of 1e-4, as scikit-learn and openTSNE
+    do for their own PCA initialization.
+
+    Args:
+        embeddings_pca: Output of reduce_dimensions
+
+    Returns:
+        Initial 2D coordinates for t-SNE
+    """
+    init = np.array(embeddings_pca[:, :2], dtype=np.float32)
+    std = init[:, 0].std()
+    if std > 0:
+        init *= 1e-4 / std
+    return init
+
+# %%
+def knn_distance_graph(embeddings: np.ndarray, perplexity: int):
+    """
+    Build the sparse k-nearest-neighbor graph that Barnes-Hut t-SNE needs.
+
+    Uses the same 3 * perplexity + 1 neighbors scikit-learn would compute
+    internally, searched on all cores. Each row also stores the sample
+    itself at distance zero, which TSNE expects from a precomputed graph.
+    Distances are squared to match the squared euclidean distances TSNE
+    uses for its affinities.
+
+    Args:
+        embeddings: Input embeddings matrix
+        perplexity: t-SNE perplexity parameter
+
+    Returns:
+        Sparse (N, N) CSR matrix of squared neighbor distances
+    """
+    n_neighbors = min(embeddings.shape[0] - 1, int(3.0 * perplexity + 1))
+    nn = NearestNeighbors(n_neighbors=n_neighbors + 1, metric='euclidean', n_jobs=-1)
+    graph = nn.fit(embeddings).kneighbors_graph(embeddings, mode='distance')
+    graph.data **= 2
+    return graph
 
 # %%
-def apply_tsne(embeddings: np.ndarray, perplexity: int = 30) -> np.ndarray:
+def apply_tsne(
+    embeddings: np.ndarray,
+    perplexity: int = 30,
+    init: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Apply t-SNE for 2D visualization.
 
+    Uses cuML's GPU t-SNE when available, otherwise openTSNE's multi-threaded
+    FFT-accelerated gradient, and falls back to scikit-learn's Barnes-Hut
+    implementation when neither is installed.
+
+    The CPU backends start from a PCA initialization rather than random
+    noise, which converges in about half the iterations and makes the
+    layout reproducible.
+
     Args:
         embeddings: Input embeddings matrix
         perplexity: t-SNE perplexity parameter
+        init: Initial 2D coordinates (defaults to each backend's PCA init)
 
     Returns:
         2D coordinates for visualization
@@ -177,13 +227,50 @@ def apply_tsne(embeddings: np.ndarray, perplexity: int = 30) -> np.ndarray:
         perplexity = max_perplexity
         print(f"  Adjusted perplexity to: {perplexity}")
 
-    tsne = TSNE(
-        n_components=2,
-        perplexity=perplexity,
-        random_state=42,
-        n_iter=1000
-    )
-    coords_2d = tsne.fit_transform(embeddings)
+    if CumlTSNE is not None:
+        print(f"  Backend: cuML (GPU)")
+        tsne = CumlTSNE(
+            n_components=2,
+            perplexity=perplexity,
+            random_state=42,
+            output_type='numpy'
+        )
+        coords_2d = np.asarray(tsne.fit_transform(embeddings))
+    elif OpenTSNE is not None:
+        # openTSNE defaults: 250 early exaggeration + 500 refinement iterations
+        print(f"  Backend: openTSNE (FFT)")
+        tsne = OpenTSNE(
+            n_components=2,
+            perplexity=perplexity,
+            initialization=init if init is not None else 'pca',
+            negative_gradient_method='fft',
+            n_jobs=-1,
+            random_state=42
+        )
+        coords_2d = np.asarray(tsne.fit(embeddings))
+    else:
+        print(f"  Backend: scikit-learn (Barnes-Hut)")
+        # TSNE rejects init='pca' with a precomputed metric, so build the
+        # PCA start here when the caller did not supply one
+        if init is None:
+            init = pca_initialization(
+                PCA(n_components=2, random_state=0).fit_transform(embeddings)
+            )
+
+        # A PCA start needs ~half the iterations of the default random init
+        tsne = TSNE(
+            n_components=2,
+            perplexity=perplexity,
+            metric='precomputed',
+            init=init,
+            early_exaggeration=12.0,
+            learning_rate='auto',
+            method='barnes_hut',
+            angle=0.5,
+            random_state=42,
+            max_iter=500
+        )
+        coords_2d = tsne.fit_transform(knn_distance_graph(embeddings, perplexity))
 
     print(f"  Output dimensions: {coords_2d.shape[1]}")
     print(f"  Final shape: {coords_2d.shape}")
@@ -191,11 +278,37 @@ def apply_tsne(embeddings: np.ndarray, perplexity: int = 30) -> np.ndarray:
 
     return coords_2d
 
+# %%
+def project_to_2d(
+    embeddings: np.ndarray,
+    pca_dims: int = 8,
+    perplexity: int = 30
+) -> np.ndarray:
+    """
+    Project embeddings to 2D with PCA followed by t-SNE.
+
+    The input is converted to a contiguous float32 matrix once and every
+    stage stays in float32, so no float64 intermediates are allocated
+    between PCA and t-SNE.
+
+    Args:
+        embeddings: Original embeddings matrix
+        pca_dims: Number of PCA dimensions before t-SNE
+        perplexity: t-SNE perplexity parameter
+
+    Returns:
+        2D coordinates for visualization
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    embeddings_pca = reduce_dimensions(embeddings, pca_dims)
+    return apply_tsne(embeddings_pca, perplexity, init=pca_initialization(embeddings_pca))
+
 # %%
 def create_visualization(
     words: List[str],
     coords_2d: np.ndarray,
-    output_file: Path
+    output_file: Path,
+    dpi: int = 150
 ) -> None:
     """
     Create and save scatter plot visualization.
@@ -204,42 +317,48 @@ def create_visualization(
         words: List of words
         coords_2d: 2D coordinates for each word
         output_file: Path to save the visualization
+        dpi: Resolution of the saved image
     """
     print(f"Creating visualization...")
 
-    plt.figure(figsize=(12, 10))
+    fig, ax = plt.subplots(figsize=(12, 10))
 
-    # Scatter plot
-    plt.scatter(coords_2d[:, 0], coords_2d[:, 1], alpha=0.6, s=100)
+    # Scatter plot (a single PathCollection for all points)
+    ax.scatter(coords_2d[:, 0], coords_2d[:, 1], alpha=0.6, s=100)
 
-    # Add word labels
-    for i, word in enumerate(words):
-        plt.annotate(
-            word,
-            xy=(coords_2d[i, 0], coords_2d[i, 1]),
-            xytext=(5, 2),
-            textcoords='offset points',
+    # Add word labels as plain Text artists offset by a shared transform;
+    # Annotation artists carry arrow/bbox machinery we never use
+    label_transform = mtransforms.offset_copy(
+        ax.transData, fig=fig, x=5, y=2, units='points'
+    )
+    for (x, y), word in zip(coords_2d, words):
+        ax.text(
+            x, y, word,
+            transform=label_transform,
             fontsize=9,
-            alpha=0.8
+            alpha=0.8,
+            clip_on=True
         )
 
-    plt.title(
+    ax.set_title(
         f't-SNE Visualization of FastText Word Embeddings\n({len(words)} words)',
         fontsize=14,
         fontweight='bold'
     )
-    plt.xlabel('t-SNE Dimension 1', fontsize=12)
-    plt.ylabel('t-SNE Dimension 2', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax.set_xlabel('t-SNE Dimension 1', fontsize=12)
+    ax.set_ylabel('t-SNE Dimension 2', fontsize=12)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
 
     # Create output directory if needed
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Save figure
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
     print(f"Saved visualization to: {output_file}")
     print(f"  Format: {output_file.suffix}")
+    print(f"  Resolution: {dpi} dpi")
     print(f"  File size: {output_file.stat().st_size / 1024:.2f} KB")
 
 # %%
@@ -282,6 +401,20 @@ def parse_args() -> argparse.Namespace:
         help="Directory containing FastText .vec model (default: data/fasttext/)"
     )
 
+    parser.add_argument(
+        '--no-model-cache',
+        action='store_false',
+        dest='use_model_cache',
+        help="Always parse the .vec file instead of using the memory-mapped .kv cache"
+    )
+
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=150,
+        help="Resolution of the output image"
+    )
+
     parser.add_argument(
         '-p', '--perplexity',
         type=int,
@@ -325,7 +458,8 @@ def main():
 
     try:
         # Load model
-        model = load_fasttext_model(model_dir)
+        model = load_fasttext_model(model_dir, args.use_model_cache)
+        print()
 
         # Read words
         words = read_words(args.input_file, args.line_limit)
@@ -341,14 +475,11 @@ def main():
         # Generate embeddings
         words, embeddings = generate_embeddings(model, words)
 
-        # Reduce dimensions with PCA
-        embeddings_pca = reduce_dimensions(embeddings, args.pca_dims)
-
-        # Apply t-SNE
-        coords_2d = apply_tsne(embeddings_pca, args.perplexity)
+        # Reduce dimensions with PCA, then t-SNE
+        coords_2d = project_to_2d(embeddings, args.pca_dims, args.perplexity)
 
         # Create visualization
-        create_visualization(words, coords_2d, args.output_image)
+        create_visualization(words, coords_2d, args.output_image, args.dpi)
 
         print(f"\n{'='*60}")
         print("Visualization completed successfully!")
@@ -0,0 +1,71 @@
+"""
+Load pre-trained FastText vectors through a memory-mapped gensim cache.
+
+Shared by the play scripts and temp/generate_embeddings.py. Parsing the
+text .vec file takes minutes, so the first load saves a gensim .kv copy
+next to it; later loads memory-map that copy instead. The copy is rebuilt
+whenever the .vec file is newer than it.
+"""
+
+from pathlib import Path
+
+from gensim.models import KeyedVectors
+
+
+def load_keyed_vectors(model_path: Path, use_cache: bool = True) -> KeyedVectors:
+    """
+    Load a .vec model file, going through its .kv cache when allowed.
+
+    Args:
+        model_path: Path to the .vec model file
+        use_cache: Whether to read/write the memory-mapped .kv cache
+
+    Returns:
+        Loaded FastText model as KeyedVectors
+    """
+    cache_path = model_path.with_suffix(".kv")
+    cache_fresh = (
+        cache_path.exists()
+        and cache_path.stat().st_mtime >= model_path.stat().st_mtime
+    )
+
+    if use_cache and cache_fresh:
+        print(f"Loading cached FastText model from: {cache_path}")
+        return KeyedVectors.load(str(cache_path), mmap="r")
+
+    print(f"Loading FastText model from: {model_path}")
+    model = KeyedVectors.load_word2vec_format(str(model_path))
+    if use_cache:
+        model.save(str(cache_path))
+        print(f"Saved model cache to: {cache_path}")
+    return model
+
+
+def load_fasttext_model(model_dir: Path, use_cache: bool = True) -> KeyedVectors:
+    """
+    Load FastText model from the specified directory.
+
+    Args:
+        model_dir: Path to directory containing .vec model file
+        use_cache: Whether to read/write the memory-mapped .kv cache
+
+    Returns:
+        Loaded FastText model as KeyedVectors
+
+    Raises:
+        FileNotFoundError: If no .vec file found in directory
+    """
+    vec_files = list(model_dir.glob("*.vec"))
+
+    if not vec_files:
+        raise FileNotFoundError(
+            f"No .vec model file found in {model_dir}. "
+            "Please download a FastText model first."
+        )
+
+    model = load_keyed_vectors(vec_files[0], use_cache)
+
+    print(f"Model loaded successfully!")
+    print(f"Model vocabulary size: {len(model)}")
+
+    return model
@@ -2,11 +2,20 @@
 """
 Execute play scripts and create Jupyter notebooks with captured output.
 """
+import os
+import re
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
+# Scripts executed when none are given on the command line
+DEFAULT_SCRIPTS = ["01_test_fasttext.py"]
+
+# Matches a "# %%" cell marker line, including its trailing newline
+CELL_MARKER_RE = re.compile(r'^[ \t]*# %%[ \t]*(?:\n|$)', re.MULTILINE)
+
 def create_notebook_with_output(py_file: Path, output_text: str):
     """Create a Jupyter notebook from a Python file with execution output."""
 
@@ -14,21 +23,8 @@ def create_notebook_with_output(py_file: Path, output_text: str):
     with open(py_file, 'r') as f:
         content = f.read()
 
-    # Parse cells (split by # %%)
-    lines = content.split('\n')
-    cells = []
-    current_cell = []
-
-    for line in lines:
-        if line.strip() == '# %%':
-            if current_cell:
-                cells.append('\n'.join(current_cell))
-            current_cell = []
-        else:
-            current_cell.append(line)
-
-    if current_cell:
-        cells.append('\n'.join(current_cell))
+    # Parse cells (split by # %%) in a single regex pass
+    cells = CELL_MARKER_RE.split(content)
 
     # Create notebook structure
     nb_cells = []
@@ -86,25 +82,41 @@ def create_notebook_with_output(py_file: Path, output_text: str):
 
     print(f"Created {nb_file}")
 
-def main():
-    play_dir = Path("play")
-
-    # Execute 01_test_fasttext.py and capture output
-    print("Executing 01_test_fasttext.py...")
+def execute_script(py_file: Path) -> bool:
+    """Execute a play script and write its notebook, returning success."""
+    print(f"Executing {py_file.name}...")
     result = subprocess.run(
-        [str(play_dir / "01_test_fasttext.py")],
+        [str(py_file)],
         capture_output=True,
         text=True,
         timeout=180
     )
 
-    if result.returncode == 0:
-        create_notebook_with_output(
-            play_dir / "01_test_fasttext.py",
-            result.stdout
-        )
-    else:
-        print(f"Error executing script: {result.stderr}")
+    if result.returncode != 0:
+        print(f"Error executing {py_file.name}: {result.stderr}")
+        return False
+
+    create_notebook_with_output(py_file, result.stdout)
+    return True
+
+def main():
+    play_dir = Path("play")
+    scripts = [play_dir / name for name in (sys.argv[1:] or DEFAULT_SCRIPTS)]
+
+    # The first script runs alone so that it writes the memory-mapped .kv
+    # model cache; the rest then map that one file read-only and share its
+    # pages instead of each parsing the .vec into its own multi-GB copy
+    first, rest = scripts[:1], scripts[1:]
+    results = [execute_script(py_file) for py_file in first]
+
+    # Each script runs in its own subprocess, so threads are enough to
+    # overlap them without pickling anything across processes
+    if rest:
+        max_workers = min(len(rest), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results.extend(executor.map(execute_script, rest))
+
+    if not all(results):
         return 1
 
     print("Done!")
@@ -45,6 +45,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compress responses for clients that accept gzip; runs after the
+    # middleware below have finished with the body
+    'django.middleware.gzip.GZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -81,6 +84,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'data' / 'db.sqlite3',
+        # Reuse each worker's connection across requests instead of opening
+        # one per request; health checks replace connections that went away
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -137,13 +144,52 @@ FASTTEXT_MODELS_DIR = BASE_DIR / 'data' / 'fasttext'
 # Temporary files directory
 TEMP_DIR = BASE_DIR / 'temp'
 
+# In-memory similarity matrix precision: 'float32' or 'int8'. int8 keeps a
+# quarter of the resident memory at a small cost in score precision
+# (~1e-3); it is upcast block by block, so scoring speed is similar.
+FINDWORD_MATRIX_DTYPE = os.environ.get('FINDWORD_MATRIX_DTYPE', 'float32')
+
+# Directory for a memory-mapped snapshot of the similarity matrices, written
+# by loadwords. Empty disables it and matrices are built from the database.
+FINDWORD_MATRIX_DIR = os.environ.get('FINDWORD_MATRIX_DIR', '')
+
+# Similarity search strategy: 'exact' scans the whole matrix; 'hnsw' asks the
+# approximate HNSW index first (needs hnswlib) and falls back to the scan.
+FINDWORD_SIMILARITY_INDEX = os.environ.get('FINDWORD_SIMILARITY_INDEX', 'exact')
+
+# Seconds find_similar_words results stay in Django's cache (0 disables).
+# Word saves and loadwords invalidate them in every process sharing the cache.
+FINDWORD_SIMILARITY_CACHE_TIMEOUT = int(os.environ.get('FINDWORD_SIMILARITY_CACHE_TIMEOUT', '300'))
+
+# Seconds rendered visualize plots stay in Django's cache (0 disables).
+# Invalidated together with the similar-word results.
+FINDWORD_VISUALIZE_CACHE_TIMEOUT = int(os.environ.get('FINDWORD_VISUALIZE_CACHE_TIMEOUT', '3600'))
+
+# Seconds between checks of the Word table for writes made by other
+# processes; they rebuild the similarity matrix and orphan cached results.
+FINDWORD_VERSION_CHECK_INTERVAL = float(os.environ.get('FINDWORD_VERSION_CHECK_INTERVAL', '5'))
+
+# Share the cache between worker processes through Redis when REDIS_URL is
+# set (needs the redis package); otherwise each process has its own. The
+# cache also carries the token that tells every process to rebuild its
+# similarity matrix after a write at once, rather than at its next
+# FINDWORD_VERSION_CHECK_INTERVAL check.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        # Plain JSONRenderer output when orjson is not installed
+        'findword_api.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
@@ -20,6 +20,7 @@ from findword_api import views as findword_views
 
 urlpatterns = [
     path('', findword_views.index, name='index'),
-    path('admin/', admin.site.urls),
+    # API routes before admin so the hot endpoints are matched first
     path('api/', include('findword_api.urls')),
+    path('admin/', admin.site.urls),
 ]
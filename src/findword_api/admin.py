@@ -1,23 +1,30 @@
 from django.contrib import admin
 from .models import Word
+from . import ann
+from .similarity import find_similar_words
 
 
 @admin.register(Word)
 class WordAdmin(admin.ModelAdmin):
     """Admin interface for Word model."""
 
-    list_display = ['word', 'is_noun', 'is_verb', 'created_at', 'updated_at']
+    list_display = ['word', 'is_noun', 'is_verb', 'embedding_norm', 'created_at', 'updated_at']
     list_filter = ['is_noun', 'is_verb', 'created_at']
     search_fields = ['word']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['embedding_preview', 'embedding_norm', 'similar_words', 'created_at', 'updated_at']
     ordering = ['word']
+    list_per_page = 100
+    show_full_result_count = False
 
     fieldsets = (
         ('Word Information', {
             'fields': ('word', 'is_noun', 'is_verb')
         }),
+        ('Similar Words', {
+            'fields': ('similar_words',),
+        }),
         ('Embedding Data', {
-            'fields': ('embedding',),
+            'fields': ('embedding_preview', 'embedding_norm'),
             'classes': ('collapse',)
         }),
         ('Timestamps', {
@@ -25,3 +32,34 @@ class WordAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+    def get_queryset(self, request):
+        """Defer the embedding column, which the change list never shows."""
+        return super().get_queryset(request).defer('embedding')
+
+    @admin.display(description='Embedding')
+    def embedding_preview(self, obj):
+        """Show the embedding dimension and its first few values."""
+        try:
+            vec = obj.get_embedding_array()
+        except ValueError:
+            return '-'
+
+        head = ', '.join(f"{x:.4f}" for x in vec[:5])
+        more = ', ...' if vec.size > 5 else ''
+        return f"[{head}{more}] ({vec.size} dimensions)"
+
+    @admin.display(description='Nearest neighbors')
+    def similar_words(self, obj):
+        """Show the nearest words, using the HNSW index when available."""
+        if obj.pk is None:
+            return '-'
+
+        try:
+            results = ann.query_similar_words(obj, limit=10)
+            if results is None:
+                results = find_similar_words(obj.word, limit=10)
+        except (Word.DoesNotExist, ValueError):
+            return '-'
+
+        return ', '.join(f"{word.word} ({sim:.3f})" for word, sim in results) or '-'
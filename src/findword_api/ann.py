@@ -0,0 +1,358 @@
+"""
+Approximate nearest-neighbor index for word embeddings.
+
+This module wraps an HNSW index (via the optional hnswlib package) built
+from every Word embedding. Building it is too slow for a request, so
+loadwords and the buildindex command build it and save it into
+FINDWORD_MATRIX_DIR. Each process loads the saved index on first use and
+shares it; while no saved index matches the Word table, none is used and
+callers fall back to the exact scan.
+"""
+
+import json
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+from django.conf import settings
+
+from .fields import EMBEDDING_DTYPE, embeddings_to_matrix
+from .models import Word
+
+# HNSW build/search parameters
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_MIN_EF = 50
+
+# Neighbors fetched per requested result, leaving room for filtered-out words
+ANN_OVERSAMPLE = 4
+
+# Files written by save_index into the snapshot directory: each save writes
+# a new index file, named with this prefix, that the metadata file names
+INDEX_PREFIX = 'hnsw-'
+INDEX_META = 'hnsw.json'
+
+_index = None
+_index_stamp = None
+_index_lock = threading.Lock()
+
+
+class WordIndex:
+    """
+    HNSW cosine index over word embeddings, labelled by Word id.
+
+    Attributes:
+        dim: Dimension of the indexed embeddings.
+        size: Number of indexed words.
+    """
+
+    def __init__(self, ids: np.ndarray, vectors: np.ndarray):
+        """
+        Build the index from parallel arrays of ids and embeddings.
+
+        Args:
+            ids: Word ids, shape (N,).
+            vectors: Embedding matrix, shape (N, D), float32.
+        """
+        self.size, self.dim = vectors.shape
+        self._index = hnswlib.Index(space='cosine', dim=self.dim)
+        self._index.init_index(
+            max_elements=self.size,
+            ef_construction=HNSW_EF_CONSTRUCTION,
+            M=HNSW_M,
+        )
+        self._index.add_items(vectors, ids)
+
+    @classmethod
+    def load(cls, path: str, dim: int) -> 'WordIndex':
+        """
+        Load an index written by hnswlib's save_index.
+
+        Args:
+            path: Index file.
+            dim: Dimension of the indexed embeddings.
+
+        Returns:
+            WordIndex: The loaded index.
+        """
+        self = cls.__new__(cls)
+        self.dim = dim
+        self._index = hnswlib.Index(space='cosine', dim=dim)
+        self._index.load_index(path)
+        self.size = self._index.get_current_count()
+        return self
+
+    def save(self, path: str) -> None:
+        """Write the index to a file."""
+        self._index.save_index(path)
+
+    def query(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """
+        Find the approximate k nearest words to a vector.
+
+        Args:
+            vector: Query embedding of shape (D,).
+            k: Number of neighbors to return.
+
+        Returns:
+            List of (word id, cosine similarity) tuples, most similar first.
+        """
+        k = min(k, self.size)
+        if k <= 0:
+            return []
+
+        self._index.set_ef(max(HNSW_MIN_EF, k * 4))
+        labels, distances = self._index.knn_query(vector, k=k)
+        return [
+            (int(label), 1.0 - float(distance))
+            for label, distance in zip(labels[0], distances[0])
+        ]
+
+
+def is_available() -> bool:
+    """Return whether the optional hnswlib dependency is installed."""
+    return hnswlib is not None
+
+
+def save_index(directory: str) -> Optional[WordIndex]:
+    """
+    Build the index from the database and save it to a snapshot directory.
+
+    Args:
+        directory: Snapshot directory, created if missing.
+
+    Returns:
+        WordIndex, or None if hnswlib is missing or there is nothing to index.
+    """
+    # Imported here since the similarity module depends on this one
+    from .similarity import publish_snapshot, snapshot_version
+
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+
+    version = snapshot_version()
+    index = build_index()
+    if index is None:
+        (root / INDEX_META).unlink(missing_ok=True)
+        return None
+
+    # A fresh file, so a process still reading the previous one is unaffected
+    name = f'{INDEX_PREFIX}{uuid.uuid4().hex}.bin'
+    index.save(str(root / name))
+    meta = {'version': version, 'dim': index.dim, 'file': name}
+    publish_snapshot(root, INDEX_META, meta, INDEX_PREFIX, name)
+    return index
+
+
+def load_index(directory: str) -> Optional[WordIndex]:
+    """
+    Load the index saved by save_index.
+
+    Args:
+        directory: Snapshot directory.
+
+    Returns:
+        WordIndex, or None if hnswlib is missing, there is no saved index,
+        or it does not match the current database.
+    """
+    from .similarity import snapshot_version
+
+    if hnswlib is None:
+        return None
+
+    root = Path(directory)
+    try:
+        meta = json.loads((root / INDEX_META).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if 'file' not in meta or meta.get('version') != snapshot_version():
+        return None
+    try:
+        return WordIndex.load(str(root / meta['file']), meta['dim'])
+    except (OSError, RuntimeError):
+        # Replaced by a newer save and removed before it could be read
+        return None
+
+
+def build_index() -> Optional[WordIndex]:
+    """
+    Build a fresh index from all words with a non-zero embedding.
+
+    Words whose embedding dimension differs from the first word's are
+    skipped, since an HNSW index has a single fixed dimension.
+
+    Returns:
+        WordIndex, or None if hnswlib is missing or there is nothing to index.
+    """
+    if hnswlib is None:
+        return None
+
+    # One SELECT for the whole table; rows stay as raw tuples
+    rows = list(Word.objects.filter(embedding_norm__gt=0).values_list('id', 'embedding'))
+    if not rows:
+        return None
+
+    nbytes = len(rows[0][1])
+    if nbytes % EMBEDDING_DTYPE.itemsize:
+        return None
+    rows = [row for row in rows if len(row[1]) == nbytes]
+
+    ids, embeddings = zip(*rows)
+    vectors = embeddings_to_matrix(embeddings, nbytes // EMBEDDING_DTYPE.itemsize)
+    return WordIndex(np.asarray(ids, dtype=np.int64), vectors)
+
+
+def get_index() -> Optional[WordIndex]:
+    """
+    Get the shared index saved in FINDWORD_MATRIX_DIR, loading it on first use.
+
+    The index is never built here. It is reloaded once the results
+    generation changes or a new index is saved, so writes and rebuilds made
+    by other processes are picked up.
+
+    Returns:
+        WordIndex, or None if hnswlib is missing, FINDWORD_MATRIX_DIR is
+        unset, or no saved index matches the Word table.
+    """
+    from .similarity import results_generation
+
+    global _index, _index_stamp
+
+    directory = getattr(settings, 'FINDWORD_MATRIX_DIR', '')
+    if hnswlib is None or not directory:
+        return None
+
+    try:
+        saved = (Path(directory) / INDEX_META).stat().st_mtime_ns
+    except OSError:
+        saved = None
+    stamp = (results_generation(), saved)
+    with _index_lock:
+        if _index_stamp != stamp:
+            _index = load_index(directory)
+            _index_stamp = stamp
+        return _index
+
+
+def invalidate_index() -> None:
+    """Discard the shared index so the next query reloads it."""
+    global _index, _index_stamp
+
+    with _index_lock:
+        _index = None
+        _index_stamp = None
+
+
+def query_similar_words(target: Word, limit: int = 10) -> Optional[List[Tuple[Word, float]]]:
+    """
+    Find words approximately most similar to a target word.
+
+    Args:
+        target: Word to find neighbors for.
+        limit: Maximum number of similar words to return.
+
+    Returns:
+        List of (Word instance, similarity score) tuples, most similar first,
+        or None if no index is available.
+
+    Raises:
+        ValueError: If the target embedding is invalid or does not match
+            the index dimension.
+    """
+    index = get_index()
+    if index is None:
+        return None
+
+    vector = target.get_embedding_array()
+    if vector.shape != (index.dim,):
+        raise ValueError(
+            f"Embedding dimension {vector.shape} does not match index dimension {index.dim}"
+        )
+
+    # Ask for one extra neighbor since the target itself is usually returned
+    neighbors = [
+        (word_id, similarity)
+        for word_id, similarity in index.query(vector, k=limit + 1)
+        if word_id != target.pk
+    ][:limit]
+
+    words = Word.objects.summaries().in_bulk([word_id for word_id, _ in neighbors])
+    return [
+        (words[word_id], similarity)
+        for word_id, similarity in neighbors
+        if word_id in words
+    ]
+
+
+def search_similar_words(
+    target: Word,
+    limit: int = 10,
+    min_similarity: float = 0.0,
+    is_noun: Optional[bool] = None,
+    is_verb: Optional[bool] = None
+) -> Optional[List[Tuple[Word, float]]]:
+    """
+    Find words approximately most similar to a target, with filters.
+
+    Fetches ANN_OVERSAMPLE neighbors per requested result and applies the
+    part-of-speech filters in the hydrating query. If the filters leave
+    fewer than limit words although the index could have supplied more,
+    None is returned so the caller can fall back to an exact scan.
+
+    Args:
+        target: Word to find neighbors for.
+        limit: Maximum number of similar words to return.
+        min_similarity: Minimum similarity threshold.
+        is_noun: Only words with this noun flag, if not None.
+        is_verb: Only words with this verb flag, if not None.
+
+    Returns:
+        List of (Word instance, similarity score) tuples, most similar first,
+        or None if no index is available or the result would be incomplete.
+
+    Raises:
+        ValueError: If the target has an invalid embedding.
+    """
+    index = get_index()
+    if index is None:
+        return None
+
+    vector = target.get_embedding_array()
+    if vector.shape != (index.dim,):
+        return None
+
+    k = (limit + 1) * ANN_OVERSAMPLE
+    raw = index.query(vector, k=k)
+    neighbors = [
+        (word_id, similarity)
+        for word_id, similarity in raw
+        if word_id != target.pk and similarity >= min_similarity
+    ]
+
+    queryset = Word.objects.summaries().filter(id__in=[word_id for word_id, _ in neighbors])
+    if is_noun is not None:
+        queryset = queryset.filter(is_noun=is_noun)
+    if is_verb is not None:
+        queryset = queryset.filter(is_verb=is_verb)
+    words = queryset.in_bulk()
+
+    results = [
+        (words[word_id], similarity)
+        for word_id, similarity in neighbors
+        if word_id in words
+    ][:limit]
+
+    # The query was cut off by k rather than by min_similarity, so words
+    # beyond it may still qualify
+    if len(results) < limit and len(raw) == k and raw[-1][1] >= min_similarity:
+        return None
+    return results
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class FindwordApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'findword_api'
+
+    def ready(self):
+        """Connect signal handlers."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,81 @@
+"""
+Custom model fields for the FindWord application.
+"""
+
+from typing import Any, List
+
+import numpy as np
+from django.db import models
+
+# Embeddings are stored as raw little-endian float32 bytes
+EMBEDDING_DTYPE = np.dtype('<f4')
+
+
+def embedding_to_array(value: Any) -> np.ndarray:
+    """
+    Convert a stored or in-memory embedding to a float32 numpy array.
+
+    Bytes read back from the database (memoryview on PostgreSQL) are viewed
+    in place without copying; lists and arrays assigned in Python are
+    converted.
+
+    Args:
+        value: Embedding as bytes, bytearray, memoryview, list, or ndarray.
+
+    Returns:
+        np.ndarray: 1-D float32 array (read-only when viewing bytes).
+
+    Raises:
+        ValueError: If the value cannot be interpreted as a float32 vector.
+    """
+    if value is None:
+        raise ValueError("Embedding is missing")
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        if len(value) % EMBEDDING_DTYPE.itemsize:
+            raise ValueError("Embedding bytes are not a whole number of float32 values")
+        return np.frombuffer(value, dtype=EMBEDDING_DTYPE)
+
+    try:
+        vec = np.asarray(value, dtype=EMBEDDING_DTYPE)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid embedding: {e}")
+
+    if vec.ndim != 1:
+        raise ValueError(f"Embedding must be one-dimensional, got shape {vec.shape}")
+    return vec
+
+
+def embeddings_to_matrix(values: List[Any], dim: int) -> np.ndarray:
+    """
+    Stack stored embeddings of one dimension into a float32 matrix.
+
+    The raw bytes are concatenated and viewed once, so no per-row arrays
+    are created.
+
+    Args:
+        values: Stored embeddings (bytes or memoryview), each of dim floats.
+        dim: Embedding dimension.
+
+    Returns:
+        np.ndarray: Read-only matrix of shape (len(values), dim).
+    """
+    return np.frombuffer(b''.join(values), dtype=EMBEDDING_DTYPE).reshape(len(values), dim)
+
+
+class EmbeddingField(models.BinaryField):
+    """
+    BinaryField holding an embedding vector as little-endian float32 bytes.
+
+    Lists, numpy arrays, and raw bytes may all be assigned; they are packed
+    to bytes when written. Values read from the database are left as bytes
+    so that loading a row does no parsing at all; use embedding_to_array
+    (or Word.get_embedding_array) to get a numpy view.
+    """
+
+    def get_prep_value(self, value):
+        """Pack the embedding into float32 bytes for the database."""
+        value = super().get_prep_value(value)
+        if value is None or isinstance(value, (bytes, bytearray, memoryview)):
+            return value
+        return embedding_to_array(value).tobytes()
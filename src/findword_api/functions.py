@@ -0,0 +1,25 @@
+"""
+Custom database functions for the FindWord application.
+"""
+
+from django.db.models import Func
+
+
+class ByteOrder(Func):
+    """
+    Compare a text expression by code point instead of by locale.
+
+    Locale collations such as en_US skip punctuation at their first level,
+    so a range like ['a-', 'a.') does not hold every word starting with
+    'a-' there. PostgreSQL gets COLLATE "C"; SQLite's default BINARY
+    collation already compares by code point, so other backends leave the
+    expression as is.
+    """
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return compiler.compile(self.source_expressions[0])
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, template='%(expressions)s COLLATE "C"', **extra_context
+        )
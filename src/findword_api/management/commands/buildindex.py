@@ -0,0 +1,39 @@
+"""
+Django management command to build and save the HNSW nearest-neighbor index.
+
+The API never builds the index itself; it loads the copy saved in
+FINDWORD_MATRIX_DIR. loadwords saves one after each load, and this command
+rebuilds it after words were changed some other way, e.g. in the admin.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from findword_api import ann
+
+
+class Command(BaseCommand):
+    """
+    Management command to build the HNSW index and save it for the API.
+
+    Usage:
+        python manage.py buildindex
+    """
+    help = 'Build the HNSW index from the database and save it to FINDWORD_MATRIX_DIR'
+
+    def handle(self, *args, **options):
+        """Main command handler."""
+        matrix_dir = getattr(settings, 'FINDWORD_MATRIX_DIR', '')
+        if not matrix_dir:
+            raise CommandError("FINDWORD_MATRIX_DIR is not set")
+        if not ann.is_available():
+            raise CommandError("hnswlib is not installed")
+
+        self.stdout.write(f"Saving HNSW index to {matrix_dir}...")
+        index = ann.save_index(matrix_dir)
+        if index is None:
+            self.stdout.write(self.style.WARNING("No embeddings to index."))
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {index.size} words of dimension {index.dim}.")
+        )
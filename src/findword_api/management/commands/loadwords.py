@@ -4,19 +4,169 @@ Django management command to load words from CSV into the database.
 This command reads words.csv and populates the Word model with words,
 their part-of-speech tags, and embeddings.
 """
+import base64
+import binascii
+import contextlib
 import csv
+import io
 import json
 import logging
+import multiprocessing
 import os
+import struct
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.core.management.color import no_style
+from django.db import connection, transaction
 from tqdm import tqdm
 
+from findword_api import ann, similarity
 from findword_api.models import Word
 
+# orjson parses long float arrays several times faster than the stdlib;
+# its JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Whitespace and quotes stripped from the word cell in one str.strip pass
+WORD_STRIP_CHARS = ' \t\r\n\f\v\'"'
+
+# Accepted noun/verb cell values
+FLAG_VALUES = {'Y': True, 'N': False}
+
+# Approximate size of the byte ranges parsed by each --jobs worker
+CSV_RANGE_BYTES = 8 * 1024 * 1024
+
+# PostgreSQL binary COPY framing: signature, flags, header extension length
+PG_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PG_COPY_TRAILER = struct.pack('>h', -1)
+
+# Staging table the PostgreSQL loader COPYs each chunk into
+STAGING_TABLE = 'findword_word_staging'
+STAGING_COLUMNS = ('word', 'is_noun', 'is_verb', 'embedding', 'embedding_norm')
+
+
+def pack_copy_binary(words: Iterable[Word]) -> bytes:
+    """
+    Encode words as a PostgreSQL binary COPY stream.
+
+    Fields follow STAGING_COLUMNS. Embedding bytes are written verbatim as
+    bytea, so no text formatting or escaping happens for the vectors.
+
+    Args:
+        words: Unsaved Word instances with embedding_norm already set
+
+    Returns:
+        The complete COPY payload, header and trailer included
+    """
+    parts = [PG_COPY_HEADER]
+    for word in words:
+        text = word.word.encode('utf-8')
+        embedding = np.asarray(word.embedding, dtype='<f4').tobytes()
+        parts.append(struct.pack('>hi', len(STAGING_COLUMNS), len(text)))
+        parts.append(text)
+        parts.append(struct.pack('>i?i?i', 1, word.is_noun, 1, word.is_verb, len(embedding)))
+        parts.append(embedding)
+        if word.embedding_norm is None:
+            parts.append(struct.pack('>i', -1))
+        else:
+            parts.append(struct.pack('>id', 8, word.embedding_norm))
+    parts.append(PG_COPY_TRAILER)
+    return b''.join(parts)
+
+
+def parse_csv_rows(
+    reader: Iterator[List[str]],
+    columns: Tuple[int, int, int, int],
+    parse_fields: Callable[[str, str, str, str], Dict[str, Any]]
+) -> Iterator[Tuple[int, Any, Any]]:
+    """
+    Parse CSV data rows, reporting bad rows instead of raising.
+
+    Args:
+        reader: csv.reader positioned after the header
+        columns: Positions of the word, noun, verb and embd columns
+        parse_fields: Converts the four cells of a row into word data
+
+    Yields:
+        (reader line number, word data or None, error message or None)
+    """
+    i_word, i_noun, i_verb, i_embd = columns
+    for row in reader:
+        if not row:
+            continue  # Blank line
+
+        try:
+            word_data = parse_fields(row[i_word], row[i_noun], row[i_verb], row[i_embd])
+        except IndexError:
+            yield reader.line_num, None, f"Missing columns - Row: {row}"
+        except ValueError as e:
+            yield reader.line_num, None, f"{e} - Row: {row}"
+        else:
+            yield reader.line_num, word_data, None
+
+
+def split_byte_ranges(file_path: str, start: int, range_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Split a file from start to EOF into byte ranges that end on a newline.
+
+    Rows must not contain quoted newlines, which holds for words.csv.
+
+    Args:
+        file_path: Path to the file
+        start: Offset of the first byte to cover
+        range_bytes: Approximate size of each range
+
+    Returns:
+        List of (start, end) offsets
+    """
+    size = os.path.getsize(file_path)
+    bounds = [start]
+    with open(file_path, 'rb') as f:
+        while bounds[-1] < size:
+            f.seek(bounds[-1] + range_bytes)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    return list(zip(bounds, bounds[1:]))
+
+
+def parse_csv_range(
+    file_path: str,
+    start: int,
+    end: int,
+    columns: Tuple[int, int, int, int]
+) -> Tuple[List[Tuple[int, Any, Any]], int]:
+    """
+    Parse one byte range of a CSV file (runs in a --jobs worker process).
+
+    Args:
+        file_path: Path to CSV file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        columns: Positions of the word, noun, verb and embd columns
+
+    Returns:
+        The parse_csv_rows results for the range, and its line count
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    reader = csv.reader(io.StringIO(text, newline=''))
+    results = list(parse_csv_rows(reader, columns, Command().parse_fields))
+    return results, reader.line_num
+
 
 class Command(BaseCommand):
     """
@@ -27,6 +177,7 @@ class Command(BaseCommand):
         python manage.py loadwords --dry-run --limit 10
         python manage.py loadwords --clear
         python manage.py loadwords --file path/to/custom.csv
+        python manage.py loadwords --jobs 8
     """
     help = 'Load words from CSV file into the database'
 
@@ -70,6 +221,12 @@ class Command(BaseCommand):
             default=1000,
             help='Number of records to process in each batch (default: 1000)'
         )
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=1,
+            help='Number of processes parsing the CSV (default: 1)'
+        )
 
     def setup_error_logging(self):
         """Set up error logging to file."""
@@ -109,54 +266,140 @@ class Command(BaseCommand):
         Raises:
             ValueError: If row data is invalid
         """
-        # Get word (remove surrounding quotes if present)
-        word = row['word'].strip().strip("'\"")
-        if not word:
-            raise ValueError("Empty word")
+        return self.parse_fields(row['word'], row['noun'], row['verb'], row['embd'])
 
-        # Parse noun/verb flags
-        noun = row['noun'].strip().upper()
-        verb = row['verb'].strip().upper()
+    def parse_fields(self, word: str, noun: str, verb: str, embd: str) -> Dict[str, Any]:
+        """
+        Parse the raw cells of one CSV row into word data.
 
-        if noun not in ('Y', 'N'):
-            raise ValueError(f"Invalid noun value: {noun}")
-        if verb not in ('Y', 'N'):
-            raise ValueError(f"Invalid verb value: {verb}")
+        Args:
+            word: The word cell
+            noun: The noun flag cell ('Y' or 'N')
+            verb: The verb flag cell ('Y' or 'N')
+            embd: The embedding cell
 
-        is_noun = noun == 'Y'
-        is_verb = verb == 'Y'
+        Returns:
+            Dictionary with parsed data
 
-        # Parse embedding
-        embd_str = row['embd'].strip()
-        try:
-            embedding = json.loads(embd_str)
-            if not isinstance(embedding, list):
-                raise ValueError("Embedding must be a list")
-            if not embedding:
-                raise ValueError("Embedding cannot be empty")
-            # Validate all elements are numbers
-            if not all(isinstance(x, (int, float)) for x in embedding):
-                raise ValueError("Embedding must contain only numbers")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in embedding: {e}")
+        Raises:
+            ValueError: If row data is invalid
+        """
+        # Get word (remove surrounding whitespace and quotes if present)
+        word = word.strip(WORD_STRIP_CHARS)
+        if not word:
+            raise ValueError("Empty word")
+
+        # Parse noun/verb flags; one dict lookup validates and converts
+        is_noun = FLAG_VALUES.get(noun.strip().upper())
+        if is_noun is None:
+            raise ValueError(f"Invalid noun value: {noun.strip()}")
+        is_verb = FLAG_VALUES.get(verb.strip().upper())
+        if is_verb is None:
+            raise ValueError(f"Invalid verb value: {verb.strip()}")
 
         return {
             'word': word,
             'is_noun': is_noun,
             'is_verb': is_verb,
-            'embedding': embedding,
+            'embedding': self.parse_embedding(embd.strip()),
         }
 
-    def read_csv_file(self, file_path: str, limit: int = None) -> List[Dict[str, Any]]:
+    def parse_embedding(self, embd_str: str) -> np.ndarray:
+        """
+        Parse an embedding cell straight into a float32 array.
+
+        Args:
+            embd_str: A JSON array, or base64 of little-endian float32 bytes
+
+        Returns:
+            1-D float32 numpy array
+
+        Raises:
+            ValueError: If the embedding is malformed, empty, or not finite
+        """
+        if embd_str.startswith('['):
+            embedding = self.parse_json_embedding(embd_str)
+        else:
+            embedding = self.parse_base64_embedding(embd_str)
+
+        if not np.isfinite(embedding).all():
+            raise ValueError("Embedding must contain only finite numbers")
+        return embedding
+
+    def parse_json_embedding(self, embd_str: str) -> np.ndarray:
+        """
+        Decode a JSON array embedding.
+
+        Args:
+            embd_str: JSON array of numbers
+
+        Returns:
+            1-D float32 numpy array
+
+        Raises:
+            ValueError: If the string is not a non-empty JSON array of numbers
+        """
+        try:
+            embedding = json_loads(embd_str)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in embedding: {e}")
+
+        if not isinstance(embedding, list):
+            raise ValueError("Embedding must be a list")
+        if not embedding:
+            raise ValueError("Embedding cannot be empty")
+        # Validate all elements are numbers (one C-level pass over types)
+        if not set(map(type, embedding)) <= {int, float}:
+            raise ValueError("Embedding must contain only numbers")
+
+        return np.asarray(embedding, dtype=np.float32)
+
+    def parse_base64_embedding(self, embd_str: str) -> np.ndarray:
+        """
+        Decode a base64-encoded float32 embedding.
+
+        Args:
+            embd_str: Base64 string of little-endian float32 bytes
+
+        Returns:
+            1-D float32 numpy array viewing the decoded bytes
+
+        Raises:
+            ValueError: If the string is not valid base64 float32 data
+        """
+        try:
+            raw = base64.b64decode(embd_str, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Invalid base64 in embedding: {e}")
+
+        if not raw:
+            raise ValueError("Embedding cannot be empty")
+        if len(raw) % 4:
+            raise ValueError("Embedding bytes are not a whole number of float32 values")
+
+        return np.frombuffer(raw, dtype='<f4')
+
+    def read_csv_file(
+        self,
+        file_path: str,
+        limit: int = None,
+        jobs: int = 1
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Read and parse CSV file.
+        Read and parse CSV file, yielding one row at a time.
+
+        Rows are never collected into a list, so memory use does not grow
+        with the size of the file. With jobs > 1 the file is split into
+        byte ranges at line boundaries and parsed by a process pool; rows
+        still come out in file order.
 
         Args:
             file_path: Path to CSV file
             limit: Maximum number of rows to read
+            jobs: Number of parser processes
 
-        Returns:
-            List of parsed word data dictionaries
+        Yields:
+            Parsed word data dictionaries
 
         Raises:
             CommandError: If file cannot be read
@@ -166,32 +409,48 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Reading CSV file: {file_path}")
 
-        words_data = []
+        parsed = 0
         errors = []
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(file_path, 'rb') as f:
+            header_line = f.readline()
+            header = next(csv.reader([header_line.decode('utf-8')]), [])
 
             # Validate headers
             required_headers = {'word', 'noun', 'verb', 'embd'}
-            if not required_headers.issubset(reader.fieldnames):
+            if not required_headers.issubset(header):
                 raise CommandError(
                     f"CSV must have headers: {required_headers}. "
-                    f"Found: {reader.fieldnames}"
+                    f"Found: {header}"
                 )
 
-            for idx, row in enumerate(reader, start=2):  # Start at 2 (header is line 1)
-                if limit and len(words_data) >= limit:
+            # Resolve column positions once and index rows as plain lists
+            columns = (
+                header.index('word'),
+                header.index('noun'),
+                header.index('verb'),
+                header.index('embd'),
+            )
+
+            if jobs > 1:
+                rows = self.parse_csv_parallel(file_path, f.tell(), columns, jobs)
+            else:
+                reader = csv.reader(io.TextIOWrapper(f, encoding='utf-8', newline=''))
+                rows = parse_csv_rows(reader, columns, self.parse_fields)
+
+            for line, word_data, error in rows:
+                if limit and parsed >= limit:
                     break
 
-                try:
-                    word_data = self.parse_csv_row(row)
-                    words_data.append(word_data)
-                except (ValueError, KeyError) as e:
-                    error_msg = f"Line {idx}: {e} - Row: {row}"
+                if error is not None:
+                    # +1 for the header line
+                    error_msg = f"Line {line + 1}: {error}"
                     errors.append(error_msg)
                     self.error_logger.error(error_msg)
                     self.stats['errors'] += 1
+                else:
+                    parsed += 1
+                    yield word_data
 
         if errors:
             self.stdout.write(
@@ -201,53 +460,247 @@ class Command(BaseCommand):
                 )
             )
 
-        return words_data
+    def parse_csv_parallel(
+        self,
+        file_path: str,
+        data_start: int,
+        columns: Tuple[int, int, int, int],
+        jobs: int
+    ) -> Iterator[Tuple[int, Any, Any]]:
+        """
+        Parse the data rows of a CSV file in a process pool.
+
+        Only a few ranges are in flight at once, so parsed rows never pile
+        up faster than the database can take them.
+
+        Args:
+            file_path: Path to CSV file
+            data_start: Byte offset of the first data row
+            columns: Positions of the word, noun, verb and embd columns
+            jobs: Number of parser processes
+
+        Yields:
+            (line number after the header, word data or None, error or None)
+        """
+        ranges = iter(split_byte_ranges(file_path, data_start, CSV_RANGE_BYTES))
+        line_base = 0
+
+        with multiprocessing.Pool(jobs) as pool:
+            pending = deque(
+                pool.apply_async(parse_csv_range, (file_path, start, end, columns))
+                for start, end in islice(ranges, jobs * 2)
+            )
+            while pending:
+                results, line_count = pending.popleft().get()
+                for start, end in islice(ranges, 1):
+                    pending.append(
+                        pool.apply_async(parse_csv_range, (file_path, start, end, columns))
+                    )
+
+                for line, word_data, error in results:
+                    yield line_base + line, word_data, error
+                line_base += line_count
 
-    def load_words_batch(self, words_data: List[Dict[str, Any]], dry_run: bool = False):
+    def load_words_batch(
+        self,
+        words_data: Iterable[Dict[str, Any]],
+        dry_run: bool = False,
+        chunk_size: int = 1000
+    ):
         """
-        Load words into database using update_or_create for each word.
+        Load words into database with one multi-row upsert per chunk.
+
+        Each chunk is written with bulk_create(update_conflicts=True), i.e. a
+        single INSERT ... ON CONFLICT (word) DO UPDATE. bulk_create skips
+        Word.save(), so the cached embedding norm is computed here. On
+        PostgreSQL the chunk is instead sent with binary COPY through a
+        staging table (see copy_upsert).
+
+        The whole load runs in one transaction so it costs a single commit;
+        each chunk gets its own savepoint. A failing chunk is rolled back and
+        retried row by row, each row in its own savepoint, so only the rows
+        that actually fail are lost and reported.
+
+        words_data is consumed lazily, chunk_size rows at a time, so only one
+        chunk of parsed embeddings is held in memory.
 
         Args:
-            words_data: List of word data dictionaries
+            words_data: Iterable of word data dictionaries
             dry_run: If True, don't actually save to database
+            chunk_size: Number of words per upsert statement
         """
-        self.stdout.write(
-            f"{'[DRY RUN] ' if dry_run else ''}Processing {len(words_data)} words..."
-        )
+        self.stdout.write(f"{'[DRY RUN] ' if dry_run else ''}Processing words...")
+
+        rows = iter(words_data)
+        chunks = iter(lambda: list(islice(rows, chunk_size)), [])
+        load_transaction = contextlib.nullcontext() if dry_run else transaction.atomic()
+
+        use_copy = not dry_run and connection.vendor == 'postgresql'
+
+        with load_transaction, tqdm(desc="Loading words", unit=" words", ncols=80) as pbar:
+            if use_copy:
+                # Durability of a bulk reload is not worth an fsync per commit
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit = off")
+                self.create_staging_table()
 
-        with tqdm(total=len(words_data), desc="Loading words", ncols=80) as pbar:
-            for word_data in words_data:
+            for chunk in chunks:
+                # Later rows win, as with a per-row update_or_create; a
+                # single upsert statement cannot touch the same row twice
+                chunk = list({data['word']: data for data in chunk}.values())
                 try:
-                    if dry_run:
-                        # Just check if word exists
-                        exists = Word.objects.filter(word=word_data['word']).exists()
-                        if exists:
-                            self.stats['updated'] += 1
-                        else:
-                            self.stats['created'] += 1
-                    else:
-                        # Actually create or update
-                        word, created = Word.objects.update_or_create(
-                            word=word_data['word'],
-                            defaults={
-                                'is_noun': word_data['is_noun'],
-                                'is_verb': word_data['is_verb'],
-                                'embedding': word_data['embedding'],
-                            }
-                        )
-                        if created:
-                            self.stats['created'] += 1
-                        else:
-                            self.stats['updated'] += 1
-
-                except Exception as e:
-                    error_msg = f"Error processing word '{word_data['word']}': {e}"
-                    self.error_logger.error(error_msg)
-                    self.stats['errors'] += 1
-                    if not dry_run:
-                        self.stdout.write(self.style.ERROR(f"  {error_msg}"))
+                    self.upsert_chunk(chunk, dry_run, use_copy)
+                except Exception:
+                    # Retry the failed chunk row by row so that one bad row
+                    # does not take the valid rest of the chunk with it
+                    for data in chunk:
+                        try:
+                            self.upsert_chunk([data], dry_run, use_copy)
+                        except Exception as e:
+                            error_msg = f"Error processing word '{data['word']}': {e}"
+                            self.error_logger.error(error_msg)
+                            self.stats['errors'] += 1
+                            if not dry_run:
+                                self.stdout.write(self.style.ERROR(f"  {error_msg}"))
+
+                pbar.update(len(chunk))
+
+    def upsert_chunk(self, chunk: List[Dict[str, Any]], dry_run: bool, use_copy: bool):
+        """
+        Upsert one chunk of word data in its own savepoint and count it.
+
+        Args:
+            chunk: Word data dictionaries with distinct words
+            dry_run: If True, only count which words would be created or updated
+            use_copy: If True, write with copy_upsert instead of bulk_create
+
+        Raises:
+            Exception: Any database error; the savepoint is rolled back first
+        """
+        existing = set(
+            Word.objects.filter(
+                word__in=[data['word'] for data in chunk]
+            ).values_list('word', flat=True)
+        )
+
+        if not dry_run:
+            words = [
+                Word(
+                    word=data['word'],
+                    is_noun=data['is_noun'],
+                    is_verb=data['is_verb'],
+                    embedding=data['embedding'],
+                )
+                for data in chunk
+            ]
+            for word in words:
+                word.embedding_norm = word.compute_embedding_norm()
+
+            with transaction.atomic():
+                if use_copy:
+                    self.copy_upsert(words)
+                else:
+                    Word.objects.bulk_create(
+                        words,
+                        batch_size=len(words),
+                        update_conflicts=True,
+                        unique_fields=['word'],
+                        update_fields=[
+                            'is_noun',
+                            'is_verb',
+                            'embedding',
+                            'embedding_norm',
+                            'updated_at',
+                        ],
+                    )
+
+        self.stats['updated'] += len(existing)
+        self.stats['created'] += len(chunk) - len(existing)
+
+    def create_staging_table(self):
+        """Create the temporary table that COPY chunks land in (PostgreSQL)."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {STAGING_TABLE} ("
+                "word varchar(100) NOT NULL, "
+                "is_noun boolean NOT NULL, "
+                "is_verb boolean NOT NULL, "
+                "embedding bytea NOT NULL, "
+                "embedding_norm double precision"
+                ") ON COMMIT DROP"
+            )
+
+    def copy_upsert(self, words: List[Word]):
+        """
+        Upsert a chunk of words with binary COPY (PostgreSQL).
+
+        The chunk is streamed into the staging table with COPY ... FORMAT
+        BINARY and merged into the Word table with one INSERT ... SELECT ...
+        ON CONFLICT, so no per-row SQL is built in Python.
+
+        Args:
+            words: Unsaved Word instances with embedding_norm already set
+        """
+        table = connection.ops.quote_name(Word._meta.db_table)
+        columns = ', '.join(STAGING_COLUMNS)
+        updates = ', '.join(
+            f"{column} = EXCLUDED.{column}"
+            for column in (*STAGING_COLUMNS[1:], 'updated_at')
+        )
+        copy_sql = f"COPY {STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+        payload = pack_copy_binary(words)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {STAGING_TABLE}")
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):  # psycopg2
+                raw_cursor.copy_expert(copy_sql, io.BytesIO(payload))
+            else:  # psycopg 3
+                with raw_cursor.copy(copy_sql) as copy:
+                    copy.write(payload)
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, created_at, updated_at) "
+                f"SELECT {columns}, now(), now() FROM {STAGING_TABLE} "
+                f"ON CONFLICT (word) DO UPDATE SET {updates}"
+            )
 
-                pbar.update(1)
+    def clear_words(self):
+        """Delete every word before a --clear reload."""
+        count = Word.objects.count()
+        # TRUNCATE on PostgreSQL, a bare DELETE on SQLite; either way
+        # no per-row collection or delete signals as with .delete().
+        # Sequences are kept, so new words never reuse the id of a
+        # cleared word that a worker's matrix may still hold.
+        connection.ops.execute_sql_flush(
+            connection.ops.sql_flush(no_style(), [Word._meta.db_table])
+        )
+        self.stdout.write(
+            self.style.WARNING(f"Deleted {count} existing words.")
+        )
+
+    @contextlib.contextmanager
+    def deferred_indexes(self):
+        """
+        Drop Word's secondary indexes for the duration of a bulk load (PostgreSQL).
+
+        Building an index once over the loaded table is much cheaper than
+        maintaining it row by row. The unique index on word stays in place,
+        since the upserts rely on it. PostgreSQL DDL is transactional, so the
+        drop, the load, and the rebuild share one transaction: a failed or
+        interrupted load rolls the indexes back with the data, and the schema
+        never disagrees with django_migrations. Readers of the table wait
+        until the load commits.
+        """
+        indexes = Word._meta.indexes
+        with transaction.atomic():
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.remove_index(Word, index)
+            yield
+            self.stdout.write("Rebuilding indexes...")
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.add_index(Word, index)
 
     def print_summary(self, dry_run: bool = False):
         """Print summary of operations."""
@@ -290,6 +743,7 @@ class Command(BaseCommand):
         dry_run = options['dry_run']
         limit = options['limit']
         chunk_size = options['chunk_size']
+        jobs = options['jobs']
 
         # Setup error logging
         log_file = self.setup_error_logging()
@@ -302,34 +756,21 @@ class Command(BaseCommand):
         self.stdout.write(f"  Dry run:    {dry_run}")
         self.stdout.write(f"  Limit:      {limit if limit else 'None (all rows)'}")
         self.stdout.write(f"  Chunk size: {chunk_size}")
+        self.stdout.write(f"  Jobs:       {jobs}")
         self.stdout.write("")
 
-        # Clear database if requested
+        # Confirm the clear now; it runs inside the load's transaction below
         if clear and not dry_run:
             confirm = input(
                 "Are you sure you want to delete all existing words? (yes/no): "
             )
-            if confirm.lower() == 'yes':
-                count = Word.objects.count()
-                Word.objects.all().delete()
-                self.stdout.write(
-                    self.style.WARNING(f"Deleted {count} existing words.")
-                )
-            else:
+            if confirm.lower() != 'yes':
                 self.stdout.write("Clear operation cancelled.")
                 return
 
         try:
-            # Read CSV file
-            words_data = self.read_csv_file(file_path, limit)
-
-            if not words_data:
-                self.stdout.write(self.style.WARNING("No valid words to load."))
-                return
-
-            self.stdout.write(
-                self.style.SUCCESS(f"Successfully parsed {len(words_data)} words.")
-            )
+            # Rows are parsed lazily as they are loaded
+            words_data = self.read_csv_file(file_path, limit, jobs)
 
             # Load words into database
             if dry_run:
@@ -339,7 +780,47 @@ class Command(BaseCommand):
                     )
                 )
 
-            self.load_words_batch(words_data, dry_run)
+            # The clear and the load share one transaction, so a failed or
+            # interrupted load leaves the old words in place
+            clear_transaction = (
+                transaction.atomic() if clear and not dry_run
+                else contextlib.nullcontext()
+            )
+            with clear_transaction:
+                if clear and not dry_run:
+                    self.clear_words()
+
+                # Into a freshly cleared table, index once after the load; only
+                # PostgreSQL can drop and rebuild inside the load's transaction
+                index_context = (
+                    self.deferred_indexes()
+                    if clear and not dry_run and connection.vendor == 'postgresql'
+                    else contextlib.nullcontext()
+                )
+                with index_context:
+                    self.load_words_batch(words_data, dry_run, chunk_size)
+
+            loaded = self.stats['created'] or self.stats['updated'] or self.stats['errors']
+
+            # Let the API processes memory-map the new matrix; it is saved
+            # first so that they rebuild from it once invalidated below
+            matrix_dir = getattr(settings, 'FINDWORD_MATRIX_DIR', '')
+            if loaded and matrix_dir and not dry_run:
+                self.stdout.write(f"Saving similarity matrix snapshot to {matrix_dir}...")
+                similarity.save_matrices(matrix_dir)
+                # The API only loads the HNSW index; it is built here
+                if ann.is_available():
+                    self.stdout.write(f"Saving HNSW index to {matrix_dir}...")
+                    ann.save_index(matrix_dir)
+
+            # Bulk writes (and --clear) skip the signals that drop cached
+            # results and make every process rebuild its matrices
+            if not dry_run:
+                similarity.invalidate_cached_results()
+
+            if not loaded:
+                self.stdout.write(self.style.WARNING("No valid words to load."))
+                return
 
             # Print summary
             self.print_summary(dry_run)
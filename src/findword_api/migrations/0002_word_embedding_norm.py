@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:36
+
+import numpy as np
+from django.db import migrations, models
+
+
+def populate_embedding_norms(apps, schema_editor):
+    """Compute the cached embedding norm for existing words."""
+    Word = apps.get_model('findword_api', 'Word')
+    batch = []
+    for word in Word.objects.only('id', 'embedding').iterator(chunk_size=1000):
+        try:
+            vec = np.asarray(word.embedding or [], dtype=np.float32)
+        except (TypeError, ValueError):
+            continue
+        word.embedding_norm = float(np.linalg.norm(vec))
+        batch.append(word)
+        if len(batch) >= 1000:
+            Word.objects.bulk_update(batch, ['embedding_norm'])
+            batch = []
+    if batch:
+        Word.objects.bulk_update(batch, ['embedding_norm'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('findword_api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='embedding_norm',
+            field=models.FloatField(blank=True, editable=False, help_text='Cached L2 norm of the embedding vector', null=True),
+        ),
+        migrations.RunPython(populate_embedding_norms, migrations.RunPython.noop),
+    ]
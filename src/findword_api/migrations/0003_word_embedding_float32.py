@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:45
+
+import findword_api.fields
+import numpy as np
+from django.db import migrations, models
+
+
+def pack_embeddings(apps, schema_editor):
+    """Copy each JSON embedding into the float32 bytes column."""
+    Word = apps.get_model('findword_api', 'Word')
+    batch = []
+    for word in Word.objects.only('id', 'embedding').iterator(chunk_size=1000):
+        try:
+            vec = np.asarray(word.embedding or [], dtype='<f4')
+        except (TypeError, ValueError):
+            vec = np.empty(0, dtype='<f4')
+        word.embedding_f32 = vec.tobytes()
+        batch.append(word)
+        if len(batch) >= 1000:
+            Word.objects.bulk_update(batch, ['embedding_f32'])
+            batch = []
+    if batch:
+        Word.objects.bulk_update(batch, ['embedding_f32'])
+
+
+def unpack_embeddings(apps, schema_editor):
+    """Copy each float32 bytes embedding back into the JSON column."""
+    Word = apps.get_model('findword_api', 'Word')
+    batch = []
+    for word in Word.objects.only('id', 'embedding_f32').iterator(chunk_size=1000):
+        word.embedding = np.frombuffer(word.embedding_f32 or b'', dtype='<f4').tolist()
+        batch.append(word)
+        if len(batch) >= 1000:
+            Word.objects.bulk_update(batch, ['embedding'])
+            batch = []
+    if batch:
+        Word.objects.bulk_update(batch, ['embedding'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('findword_api', '0002_word_embedding_norm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='embedding_f32',
+            field=findword_api.fields.EmbeddingField(null=True),
+        ),
+        # Let the JSON column go empty so this migration can be reversed
+        migrations.AlterField(
+            model_name='word',
+            name='embedding',
+            field=models.JSONField(help_text='Store embedding vector as JSON array', null=True),
+        ),
+        migrations.RunPython(pack_embeddings, unpack_embeddings),
+        migrations.RemoveField(
+            model_name='word',
+            name='embedding',
+        ),
+        migrations.RenameField(
+            model_name='word',
+            old_name='embedding_f32',
+            new_name='embedding',
+        ),
+        migrations.AlterField(
+            model_name='word',
+            name='embedding',
+            field=findword_api.fields.EmbeddingField(help_text='Embedding vector as little-endian float32 bytes'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('findword_api', '0003_word_embedding_float32'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='word',
+            name='word_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='word',
+            name='noun_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='word',
+            name='verb_idx',
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['is_noun', 'is_verb'], name='pos_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:00
+
+import django.db.models.functions.text
+import findword_api.functions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('findword_api', '0004_word_pos_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(findword_api.functions.ByteOrder(django.db.models.functions.text.Lower('word')), name='word_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:29
+
+import django.db.models.functions.text
+import findword_api.functions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('findword_api', '0005_word_lower_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(findword_api.functions.ByteOrder(django.db.models.functions.text.Lower('word')), condition=models.Q(('is_noun', True)), name='word_lower_noun_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(findword_api.functions.ByteOrder(django.db.models.functions.text.Lower('word')), condition=models.Q(('is_verb', True)), name='word_lower_verb_idx'),
+        ),
+    ]
@@ -1,7 +1,95 @@
+import sys
 from typing import List, Optional
 import numpy as np
 from django.db import models
-from django.db.models import Q
+from django.db.models import Q, Value
+from django.db.models.functions import Concat, Lower
+
+from .fields import EmbeddingField, embedding_to_array
+from .functions import ByteOrder
+
+
+# Largest code point, a noncharacter that sorts after every character in a word
+MAX_CHAR = chr(sys.maxunicode)
+
+
+class WordQuerySet(models.QuerySet):
+    """QuerySet for Word with helpers for the common column subsets."""
+
+    # Columns needed to list a word; everything except the embedding blobs
+    SUMMARY_FIELDS = ('id', 'word', 'is_noun', 'is_verb')
+
+    def summaries(self) -> 'WordQuerySet':
+        """
+        Load only the columns used by list and similarity responses.
+
+        Skips fetching each row's embedding, which dominates the row size.
+
+        Returns:
+            WordQuerySet: The queryset with all other fields deferred.
+        """
+        return self.only(*self.SUMMARY_FIELDS)
+
+    def matching(self, word: str) -> 'WordQuerySet':
+        """
+        Filter to words equal to word ignoring case.
+
+        Compares LOWER(word) so that word_lower_idx serves the lookup. word
+        goes through the same LOWER, since str.lower disagrees with it on
+        SQLite, which folds only ASCII letters.
+
+        Args:
+            word: Text to match.
+
+        Returns:
+            WordQuerySet: Words whose lowercase form equals word's.
+        """
+        return self.alias(word_lower=ByteOrder(Lower('word'))).filter(
+            word_lower=Lower(Value(word))
+        )
+
+    def prefixed(self, prefix: str) -> 'WordQuerySet':
+        """
+        Filter to words starting with prefix ignoring case.
+
+        LIKE cannot use word_lower_idx, but a range on it can. In the code
+        point order of ByteOrder, the words from LOWER(prefix) up to
+        LOWER(prefix) followed by MAX_CHAR are exactly those starting with
+        it, barring words that continue with MAX_CHAR, a noncharacter. Both
+        bounds are lowered in SQL, like matching.
+
+        Args:
+            prefix: Non-empty text the words must start with.
+
+        Returns:
+            WordQuerySet: Words whose lowercase form starts with prefix's.
+        """
+        lowered = Lower(Value(prefix))
+        return self.alias(word_lower=ByteOrder(Lower('word'))).filter(
+            word_lower__gte=lowered,
+            word_lower__lte=Concat(lowered, Value(MAX_CHAR)),
+        )
+
+    def get_word(self, word: str) -> 'Word':
+        """
+        Get a word case-insensitively, preferring an exact-case match.
+
+        Args:
+            word: Text to look up.
+
+        Returns:
+            Word: The exact match if stored, else the first case variant.
+
+        Raises:
+            Word.DoesNotExist: If no word matches ignoring case.
+        """
+        matches = list(self.matching(word))
+        for match in matches:
+            if match.word == word:
+                return match
+        if matches:
+            return matches[0]
+        raise self.model.DoesNotExist(f"Word '{word}' not found in database")
 
 
 class Word(models.Model):
@@ -24,8 +112,14 @@ class Word(models.Model):
         default=False,
         help_text="Whether word can be used as verb"
     )
-    embedding = models.JSONField(
-        help_text="Store embedding vector as JSON array"
+    embedding = EmbeddingField(
+        help_text="Embedding vector as little-endian float32 bytes"
+    )
+    embedding_norm = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Cached L2 norm of the embedding vector"
     )
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -36,38 +130,85 @@ class Word(models.Model):
         help_text="Timestamp when word was last updated"
     )
 
+    objects = WordQuerySet.as_manager()
+
     class Meta:
         ordering = ['word']
         verbose_name = 'Word'
         verbose_name_plural = 'Words'
+        # word is already indexed by its unique constraint
         indexes = [
-            models.Index(fields=['word'], name='word_idx'),
-            models.Index(fields=['is_noun'], name='noun_idx'),
-            models.Index(fields=['is_verb'], name='verb_idx'),
+            models.Index(fields=['is_noun', 'is_verb'], name='pos_idx'),
+            # Byte-ordered so prefix ranges match exactly and can seek them
+            models.Index(ByteOrder(Lower('word')), name='word_lower_idx'),
+            # Prefix search filtered by part of speech seeks only those rows
+            models.Index(
+                ByteOrder(Lower('word')), condition=Q(is_noun=True), name='word_lower_noun_idx'
+            ),
+            models.Index(
+                ByteOrder(Lower('word')), condition=Q(is_verb=True), name='word_lower_verb_idx'
+            ),
         ]
 
     def __str__(self) -> str:
         """Return the word as string representation."""
         return self.word
 
+    def save(self, *args, **kwargs):
+        """Save the word, refreshing the cached embedding norm."""
+        self.embedding_norm = self.compute_embedding_norm()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'embedding' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'embedding_norm'}
+
+        super().save(*args, **kwargs)
+
+    def compute_embedding_norm(self) -> Optional[float]:
+        """
+        Calculate the L2 norm of the current embedding.
+
+        Returns:
+            float: The L2 norm, or None if the embedding is not numeric.
+        """
+        try:
+            vec = embedding_to_array(self.embedding)
+        except ValueError:
+            return None
+        return float(np.linalg.norm(vec))
+
+    def get_embedding_norm(self) -> float:
+        """
+        Get the L2 norm of the embedding, using the cached value if present.
+
+        Returns:
+            float: The L2 norm of the embedding vector.
+        """
+        if self.embedding_norm is not None:
+            return self.embedding_norm
+        return float(np.linalg.norm(self.get_embedding_array()))
+
     def get_embedding_array(self) -> np.ndarray:
         """
-        Convert the JSON embedding to a numpy array.
+        Get the embedding as a numpy array.
+
+        Stored embeddings are viewed in place (read-only) rather than parsed.
 
         Returns:
-            np.ndarray: The embedding vector as numpy array.
+            np.ndarray: The embedding vector as a float32 numpy array.
 
         Raises:
             ValueError: If embedding is empty or invalid.
         """
-        if not self.embedding:
-            raise ValueError(f"Word '{self.word}' has no embedding")
-
         try:
-            return np.array(self.embedding, dtype=np.float32)
-        except (TypeError, ValueError) as e:
+            vec = embedding_to_array(self.embedding)
+        except ValueError as e:
             raise ValueError(f"Invalid embedding format for word '{self.word}': {e}")
 
+        if vec.size == 0:
+            raise ValueError(f"Word '{self.word}' has no embedding")
+        return vec
+
     def cosine_similarity(self, other_word: 'Word') -> float:
         """
         Calculate cosine similarity between this word and another word.
@@ -92,15 +233,14 @@ class Word(models.Model):
                 f"Embedding dimensions don't match: {vec1.shape} vs {vec2.shape}"
             )
 
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        # Calculate cosine similarity using the cached norms
+        norm1 = self.get_embedding_norm()
+        norm2 = other_word.get_embedding_norm()
 
         if norm1 == 0 or norm2 == 0:
             return 0.0
 
-        return float(dot_product / (norm1 * norm2))
+        return float(np.dot(vec1, vec2) / (norm1 * norm2))
 
     def get_similar_words(
         self,
@@ -125,29 +265,13 @@ class Word(models.Model):
         Raises:
             ValueError: If this word has invalid embeddings.
         """
-        # Get this word's embedding
-        this_embedding = self.get_embedding_array()
-
-        # Build queryset with filters
-        queryset = Word.objects.exclude(id=self.id)
-
-        if is_noun is not None:
-            queryset = queryset.filter(is_noun=is_noun)
-        if is_verb is not None:
-            queryset = queryset.filter(is_verb=is_verb)
-
-        # Calculate similarities for all words
-        similar_words = []
-
-        for word in queryset:
-            try:
-                similarity = self.cosine_similarity(word)
-                if similarity >= min_similarity:
-                    similar_words.append((word, similarity))
-            except (ValueError, TypeError):
-                # Skip words with invalid embeddings
-                continue
+        # Imported here since the similarity module depends on this one
+        from .similarity import rank_similar_words
 
-        # Sort by similarity (descending) and limit results
-        similar_words.sort(key=lambda x: x[1], reverse=True)
-        return similar_words[:limit]
+        return rank_similar_words(
+            self,
+            limit=limit,
+            min_similarity=min_similarity,
+            is_noun=is_noun,
+            is_verb=is_verb,
+        )
@@ -5,10 +5,52 @@ This module provides Django REST Framework serializers for converting
 Word model instances to/from JSON representations.
 """
 
+from typing import Any, Dict, List, Tuple
+
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from .models import Word
 
 
+def part_of_speech(word: Word) -> List[str]:
+    """Get human-readable part of speech tags for a word."""
+    pos = []
+    if word.is_noun:
+        pos.append('noun')
+    if word.is_verb:
+        pos.append('verb')
+    return pos if pos else ['unknown']
+
+
+def similar_words_payload(results: List[Tuple[Word, float]]) -> List[Dict[str, Any]]:
+    """
+    Build the SimilarWordSerializer representation of similarity results.
+
+    Produces the same data as SimilarWordSerializer(many=True) with plain
+    dicts, skipping the per-field serializer machinery on the hot
+    similar-words endpoint. Keep it in step with WordListSerializer.
+
+    Args:
+        results: (Word instance, similarity score) tuples.
+
+    Returns:
+        List of {'word': {...}, 'similarity': float} dictionaries.
+    """
+    return [
+        {
+            'word': {
+                'id': word.id,
+                'word': word.word,
+                'is_noun': word.is_noun,
+                'is_verb': word.is_verb,
+                'part_of_speech': part_of_speech(word),
+            },
+            'similarity': float(similarity),
+        }
+        for word, similarity in results
+    ]
+
+
 class WordSerializer(serializers.ModelSerializer):
     """
     Full serializer for Word model including embedding vector.
@@ -16,6 +58,7 @@ class WordSerializer(serializers.ModelSerializer):
     Use this for detailed word retrieval where the embedding vector
     is needed for client-side calculations or analysis.
     """
+    embedding = serializers.SerializerMethodField()
     embedding_dimension = serializers.SerializerMethodField()
 
     class Meta:
@@ -32,11 +75,25 @@ class WordSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    @extend_schema_field(serializers.ListField(child=serializers.FloatField()))
+    def get_embedding(self, obj):
+        """
+        Get the embedding vector as a list of floats.
+
+        Each float32 goes through its shortest repr, so 0.1 is returned as
+        0.1 rather than as its widened double 0.10000000149011612.
+        """
+        try:
+            return [float(value) for value in obj.get_embedding_array().astype(str)]
+        except ValueError:
+            return []
+
     def get_embedding_dimension(self, obj):
         """Get the dimension of the embedding vector."""
-        if obj.embedding:
-            return len(obj.embedding)
-        return 0
+        try:
+            return obj.get_embedding_array().size
+        except ValueError:
+            return 0
 
 
 class WordListSerializer(serializers.ModelSerializer):
@@ -60,12 +117,7 @@ class WordListSerializer(serializers.ModelSerializer):
 
     def get_part_of_speech(self, obj):
         """Get human-readable part of speech tags."""
-        pos = []
-        if obj.is_noun:
-            pos.append('noun')
-        if obj.is_verb:
-            pos.append('verb')
-        return pos if pos else ['unknown']
+        return part_of_speech(obj)
 
 
 class SimilarWordSerializer(serializers.Serializer):
@@ -0,0 +1,20 @@
+"""
+Signal handlers for the FindWord application.
+
+Keeps process-level caches derived from the Word table in sync with it.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import ann, similarity
+from .models import Word
+
+
+@receiver(post_save, sender=Word)
+@receiver(post_delete, sender=Word)
+def invalidate_word_caches(sender, **kwargs):
+    """Discard cached embedding indexes and results when a word changes."""
+    ann.invalidate_index()
+    similarity.invalidate_matrices()
+    similarity.invalidate_cached_results()
@@ -5,11 +5,473 @@ This module provides functions to calculate cosine similarity between word
 embeddings and find similar words using vectorized numpy operations.
 """
 
-from typing import List, Optional, Tuple
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import numpy as np
-from django.db.models import Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
 
+from . import ann
+from .fields import EMBEDDING_DTYPE, embeddings_to_matrix
 from .models import Word
+from .similarity_kernels import int8_scores
+
+# Rows upcast to float32 at a time when scoring a reduced-precision matrix
+SCORE_BLOCK_ROWS = 8192
+
+# An int8 matrix picks this many candidates per requested result, and
+# loosens min_similarity by this much, before the exact float32 rerank
+INT8_RERANK_OVERSAMPLE = 4
+INT8_SCORE_SLACK = 0.01
+
+# Arrays written per dimension by save_matrices, and the metadata file
+# that records which database state they were built from
+SNAPSHOT_ARRAYS = ('ids', 'vectors', 'scales', 'is_noun', 'is_verb')
+SNAPSHOT_META = 'meta.json'
+
+# Prefix of the directory each save_matrices call writes its arrays into
+SNAPSHOT_PREFIX = 'matrices-'
+
+# Cache key holding a token that is part of every cached result's key;
+# replacing the token orphans all cached results at once
+RESULTS_GENERATION_KEY = 'findword:similar:generation'
+
+_matrices = None
+_matrices_generation = None
+_matrices_lock = threading.Lock()
+
+_database_version = None
+_database_version_checked = 0.0
+_database_version_lock = threading.Lock()
+
+
+class EmbeddingMatrix:
+    """
+    Row-normalized embeddings of every word with one embedding dimension.
+
+    Rows are kept in a single contiguous matrix so that scoring all
+    candidates against a query is one matrix-vector product. The matrix may
+    be stored as int8 with a per-row scale to save memory.
+
+    Attributes:
+        ids: Word ids, shape (N,).
+        vectors: L2-normalized embeddings, shape (N, D), float32 or int8.
+        scales: Per-row dequantization scales for int8 vectors, else None.
+        is_noun: Noun flags, shape (N,).
+        is_verb: Verb flags, shape (N,).
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        is_noun: np.ndarray,
+        is_verb: np.ndarray,
+        scales: Optional[np.ndarray] = None
+    ):
+        self.ids = ids
+        self.vectors = vectors
+        self.scales = scales
+        self.is_noun = is_noun
+        self.is_verb = is_verb
+        self._blocks = {}
+
+    @classmethod
+    def from_float32(
+        cls,
+        ids: np.ndarray,
+        vectors: np.ndarray,
+        is_noun: np.ndarray,
+        is_verb: np.ndarray,
+        dtype: str = 'float32'
+    ) -> 'EmbeddingMatrix':
+        """
+        Build a matrix from normalized float32 rows, converting to dtype.
+
+        Args:
+            ids: Word ids, shape (N,).
+            vectors: L2-normalized float32 embeddings, shape (N, D).
+            is_noun: Noun flags, shape (N,).
+            is_verb: Verb flags, shape (N,).
+            dtype: Storage type: 'float32' or 'int8'.
+
+        Returns:
+            EmbeddingMatrix: The matrix in the requested precision.
+
+        Raises:
+            ValueError: If dtype is not supported.
+        """
+        if dtype == 'float32':
+            return cls(ids, vectors, is_noun, is_verb)
+        if dtype == 'int8':
+            # Symmetric per-row quantization; rows are non-zero by construction
+            scales = np.abs(vectors).max(axis=1) / 127
+            quantized = np.rint(vectors / scales[:, None]).astype(np.int8)
+            return cls(ids, quantized, is_noun, is_verb, scales.astype(np.float32))
+        raise ValueError(f"Unsupported embedding matrix dtype: {dtype}")
+
+    def restrict(
+        self,
+        is_noun: Optional[bool] = None,
+        is_verb: Optional[bool] = None
+    ) -> 'EmbeddingMatrix':
+        """
+        Narrow the matrix to the rows that can match a part-of-speech filter.
+
+        build_matrices groups rows by part of speech, so the rows matching
+        a noun or verb filter form one contiguous block. That block is
+        returned as a view of this matrix, so a filtered query is a smaller
+        dense scan and nothing is copied. When the matching rows are not
+        contiguous, the whole matrix is returned and callers still mask.
+
+        Args:
+            is_noun: Only words with this noun flag, if not None.
+            is_verb: Only words with this verb flag, if not None.
+
+        Returns:
+            EmbeddingMatrix: This matrix or a view of a block of its rows.
+        """
+        if is_noun is None and is_verb is None:
+            return self
+
+        key = (is_noun, is_verb)
+        block = self._blocks.get(key)
+        if block is None:
+            keep = np.ones(len(self.ids), dtype=bool)
+            if is_noun is not None:
+                keep &= self.is_noun == is_noun
+            if is_verb is not None:
+                keep &= self.is_verb == is_verb
+            rows = np.flatnonzero(keep)
+            start, stop = (rows[0], rows[-1] + 1) if len(rows) else (0, 0)
+
+            block = self
+            if stop - start == len(rows):
+                rows = slice(start, stop)
+                block = EmbeddingMatrix(
+                    self.ids[rows],
+                    self.vectors[rows],
+                    self.is_noun[rows],
+                    self.is_verb[rows],
+                    self.scales[rows] if self.scales is not None else None,
+                )
+            self._blocks[key] = block
+        return block
+
+    def scores(self, target: np.ndarray, target_norm: Optional[float] = None) -> np.ndarray:
+        """
+        Calculate cosine similarity between a target vector and every row.
+
+        Args:
+            target: Query embedding of shape (D,).
+            target_norm: L2 norm of target, if already known.
+
+        Returns:
+            np.ndarray: Similarity scores, shape (N,).
+        """
+        if target_norm is None:
+            target_norm = np.linalg.norm(target)
+        target = np.asarray(target, dtype=np.float32) / np.float32(target_norm)
+
+        if self.vectors.dtype == np.float32:
+            return self.vectors @ target
+
+        scores = np.empty(len(self.ids), dtype=np.float32)
+        if int8_scores is not None:
+            int8_scores(self.vectors, target, self.scales, scores)
+            return scores
+
+        # numpy has no BLAS kernel for int8, so upcast a cache-sized block
+        # at a time and let float32 sgemv do the work
+        for start in range(0, len(scores), SCORE_BLOCK_ROWS):
+            block = self.vectors[start:start + SCORE_BLOCK_ROWS]
+            np.matmul(block.astype(np.float32), target, out=scores[start:start + len(block)])
+        scores *= self.scales
+        return scores
+
+
+def snapshot_version() -> str:
+    """
+    Fingerprint the Word table so a saved snapshot can be checked for staleness.
+
+    Inserts and deletes change the row count or highest id, and saves bump
+    updated_at. Bulk QuerySet.update() calls that skip updated_at are not
+    detected, just as they skip the cache-invalidating signals.
+
+    Returns:
+        str: Opaque version string.
+    """
+    stats = Word.objects.aggregate(
+        count=Count('id'), max_id=Max('id'), updated=Max('updated_at')
+    )
+    updated = stats['updated'].isoformat() if stats['updated'] else ''
+    return f"{stats['count']}:{stats['max_id']}:{updated}"
+
+
+def publish_snapshot(root: Path, meta_name: str, meta: dict, prefix: str, current: str) -> None:
+    """
+    Point a snapshot's metadata file at newly written files, atomically.
+
+    The metadata is written to a temporary file and renamed over the old
+    one, so readers see either the previous snapshot or the new one in
+    full. Files of earlier snapshots are then unlinked rather than
+    overwritten: processes that have them memory-mapped keep their pages,
+    whereas truncating a mapped file would crash them with SIGBUS.
+
+    Args:
+        root: Snapshot directory.
+        meta_name: Name of the metadata file in root.
+        meta: Metadata to write; it names the new files.
+        prefix: Name prefix shared by the files of every snapshot.
+        current: Name of the newly written file or directory, kept.
+    """
+    path = root / meta_name
+    tmp = root / f'.{meta_name}.{uuid.uuid4().hex}.tmp'
+    tmp.write_text(json.dumps(meta))
+    os.replace(tmp, path)
+
+    for stale in root.glob(f'{prefix}*'):
+        if stale.name == current:
+            continue
+        if stale.is_dir():
+            shutil.rmtree(stale, ignore_errors=True)
+        else:
+            stale.unlink(missing_ok=True)
+
+
+def save_matrices(directory: str) -> Dict[int, EmbeddingMatrix]:
+    """
+    Build the embedding matrices from the database and save them as .npy files.
+
+    Every save writes a new subdirectory, with one directory of plain .npy
+    arrays per dimension, so that load_matrices can memory-map them. The
+    metadata file is then switched to it with publish_snapshot, so a
+    half-written snapshot is never loaded and mapped files never change.
+
+    Args:
+        directory: Snapshot directory, created if missing.
+
+    Returns:
+        Dictionary mapping embedding dimension to its EmbeddingMatrix.
+    """
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+
+    version = snapshot_version()
+    matrices = build_matrices(use_snapshot=False)
+
+    name = f'{SNAPSHOT_PREFIX}{uuid.uuid4().hex}'
+    (root / name).mkdir()
+    for dim, matrix in matrices.items():
+        (root / name / str(dim)).mkdir()
+        for array_name in SNAPSHOT_ARRAYS:
+            array = getattr(matrix, array_name)
+            if array is not None:
+                np.save(root / name / str(dim) / f'{array_name}.npy', np.ascontiguousarray(array))
+
+    meta = {
+        'version': version,
+        'dtype': getattr(settings, 'FINDWORD_MATRIX_DTYPE', 'float32'),
+        'dims': sorted(matrices),
+        'path': name,
+    }
+    publish_snapshot(root, SNAPSHOT_META, meta, SNAPSHOT_PREFIX, name)
+    return matrices
+
+
+def load_matrices(directory: str) -> Optional[Dict[int, EmbeddingMatrix]]:
+    """
+    Memory-map the embedding matrices saved by save_matrices.
+
+    The arrays stay in the OS page cache and are shared by every process
+    that maps them, instead of being rebuilt from the database per process.
+
+    Args:
+        directory: Snapshot directory.
+
+    Returns:
+        Dictionary mapping embedding dimension to its EmbeddingMatrix, or None
+        if there is no snapshot or it does not match the current database or
+        matrix dtype.
+    """
+    root = Path(directory)
+    try:
+        meta = json.loads((root / SNAPSHOT_META).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if 'path' not in meta:
+        return None
+    if meta.get('dtype') != getattr(settings, 'FINDWORD_MATRIX_DTYPE', 'float32'):
+        return None
+    if meta.get('version') != snapshot_version():
+        return None
+
+    matrices = {}
+    try:
+        for dim in meta['dims']:
+            arrays = {}
+            for name in SNAPSHOT_ARRAYS:
+                path = root / meta['path'] / str(dim) / f'{name}.npy'
+                # Only float32 snapshots leave out an array (the scales)
+                if name == 'scales' and not path.exists():
+                    arrays[name] = None
+                else:
+                    arrays[name] = np.load(path, mmap_mode='r')
+            matrices[dim] = EmbeddingMatrix(**arrays)
+    except OSError:
+        # Replaced by a newer save and removed while being opened
+        return None
+    return matrices
+
+
+def build_matrices(use_snapshot: bool = True) -> Dict[int, EmbeddingMatrix]:
+    """
+    Load every valid, non-zero embedding into per-dimension matrices.
+
+    Rows are normalized with the embedding_norm cached on each Word, so no
+    norms are recomputed here. If FINDWORD_MATRIX_DIR holds an up-to-date
+    snapshot, it is memory-mapped instead of reading the embeddings.
+
+    Args:
+        use_snapshot: Whether to try the saved snapshot first.
+
+    Returns:
+        Dictionary mapping embedding dimension to its EmbeddingMatrix.
+    """
+    directory = getattr(settings, 'FINDWORD_MATRIX_DIR', '')
+    if use_snapshot and directory:
+        matrices = load_matrices(directory)
+        if matrices is not None:
+            return matrices
+
+    # One SELECT for the whole table; rows stay as raw tuples
+    queryset = Word.objects.filter(embedding_norm__gt=0).values_list(
+        'id', 'embedding', 'embedding_norm', 'is_noun', 'is_verb'
+    )
+    groups = {}
+    for row in queryset:
+        nbytes = len(row[1])
+        if nbytes % EMBEDDING_DTYPE.itemsize == 0:
+            groups.setdefault(nbytes // EMBEDDING_DTYPE.itemsize, []).append(row)
+
+    dtype = getattr(settings, 'FINDWORD_MATRIX_DTYPE', 'float32')
+    matrices = {}
+    for dim, group in groups.items():
+        # Order rows noun-only, noun and verb, verb-only, neither, so that
+        # every noun or verb filter matches a contiguous block of rows
+        group.sort(key=lambda row: (not row[3], row[3] == row[4]))
+        ids, embeddings, norms, is_noun, is_verb = zip(*group)
+        vectors = embeddings_to_matrix(embeddings, dim) / np.asarray(norms, dtype=np.float32)[:, None]
+        matrices[dim] = EmbeddingMatrix.from_float32(
+            np.asarray(ids, dtype=np.int64),
+            vectors,
+            np.asarray(is_noun, dtype=bool),
+            np.asarray(is_verb, dtype=bool),
+            dtype=dtype,
+        )
+    return matrices
+
+
+def get_matrix(dim: int) -> Optional[EmbeddingMatrix]:
+    """
+    Get the shared embedding matrix for a dimension, building all on first use.
+
+    The matrices remember the results generation they were built under and
+    are rebuilt once it changes, so writes made by other processes (another
+    worker, loadwords) are picked up as well: at once through a shared
+    cache, otherwise within FINDWORD_VERSION_CHECK_INTERVAL seconds.
+
+    Args:
+        dim: Embedding dimension.
+
+    Returns:
+        EmbeddingMatrix, or None if no word has an embedding of that dimension.
+    """
+    global _matrices, _matrices_generation
+
+    # Read before building, so a change made during the build is noticed
+    # on the next call
+    generation = results_generation()
+    with _matrices_lock:
+        if _matrices is None or _matrices_generation != generation:
+            _matrices = build_matrices()
+            _matrices_generation = generation
+        return _matrices.get(dim)
+
+
+def invalidate_matrices() -> None:
+    """Discard the shared embedding matrices so the next query rebuilds them."""
+    global _matrices, _matrices_generation
+
+    with _matrices_lock:
+        _matrices = None
+        _matrices_generation = None
+
+
+def invalidate_cached_results() -> None:
+    """Discard every cached result derived from the Word table, in all processes."""
+    global _database_version
+
+    cache.set(RESULTS_GENERATION_KEY, uuid.uuid4().hex, None)
+    with _database_version_lock:
+        _database_version = None
+
+
+def database_version() -> str:
+    """
+    Get the Word table fingerprint, re-read at most once per check interval.
+
+    The generation token only reaches other processes through a shared
+    cache. Each process's own LocMemCache never sees it, so the table
+    itself is checked every FINDWORD_VERSION_CHECK_INTERVAL seconds as well.
+
+    Returns:
+        str: The snapshot_version of the Word table as last read.
+    """
+    global _database_version, _database_version_checked
+
+    interval = getattr(settings, 'FINDWORD_VERSION_CHECK_INTERVAL', 5)
+    with _database_version_lock:
+        now = time.monotonic()
+        if _database_version is None or now - _database_version_checked >= interval:
+            _database_version = snapshot_version()
+            _database_version_checked = now
+        return _database_version
+
+
+def results_generation() -> str:
+    """
+    Get the token that cached results derived from the Word table are keyed on.
+
+    Returns:
+        str: Token that changes whenever invalidate_cached_results is called
+        or database_version notices a change to the Word table.
+    """
+    token = cache.get_or_set(RESULTS_GENERATION_KEY, uuid.uuid4().hex, None)
+    return f"{token}:{database_version()}"
+
+
+def results_cache_key(
+    target_word: str,
+    part_of_speech: Optional[str],
+    limit: int,
+    min_similarity: float
+) -> str:
+    """
+    Build the cache key for one find_similar_words query.
+
+    Returns:
+        str: Key that changes whenever invalidate_cached_results is called.
+    """
+    return f"findword:similar:{results_generation()}:{target_word}:{part_of_speech}:{limit}:{min_similarity}"
 
 
 def calculate_cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -53,6 +515,102 @@ def calculate_cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return float(dot_product / (norm1 * norm2))
 
 
+def rank_similar_words(
+    target: Word,
+    limit: int = 10,
+    min_similarity: float = 0.0,
+    is_noun: Optional[bool] = None,
+    is_verb: Optional[bool] = None
+) -> List[Tuple[Word, float]]:
+    """
+    Rank the words most similar to a target Word instance.
+
+    Scores the target against the shared in-memory embedding matrix and
+    hydrates only the top results, so no per-candidate Word instances are
+    built. With FINDWORD_SIMILARITY_INDEX = 'hnsw' the HNSW index is asked
+    first, and the exact scan is only used when it cannot answer.
+    Candidates with a zero or invalid embedding, or a different dimension,
+    are never returned.
+
+    Args:
+        target: Word to find neighbors for.
+        limit: Maximum number of similar words to return (default: 10).
+        min_similarity: Minimum similarity threshold (default: 0.0).
+        is_noun: Only words with this noun flag, if not None.
+        is_verb: Only words with this verb flag, if not None.
+
+    Returns:
+        List of tuples containing (Word instance, similarity score),
+        sorted by similarity in descending order.
+
+    Raises:
+        ValueError: If the target has an invalid embedding.
+    """
+    target_embedding = target.get_embedding_array()
+    if not np.any(target_embedding):
+        return []
+
+    if limit <= 0:
+        return []
+
+    if getattr(settings, 'FINDWORD_SIMILARITY_INDEX', 'exact') == 'hnsw':
+        results = ann.search_similar_words(target, limit, min_similarity, is_noun, is_verb)
+        if results is not None:
+            return results
+
+    # Candidates with a different dimension can never match the target
+    matrix = get_matrix(target_embedding.size)
+    if matrix is None:
+        return []
+    matrix = matrix.restrict(is_noun, is_verb)
+
+    # Score every candidate with one matrix-vector product
+    target_norm = target.get_embedding_norm()
+    scores = matrix.scores(target_embedding, target_norm)
+
+    # Quantized scores are only good enough to pick candidates: loosen the
+    # threshold by the quantization error and take extra rows to rerank
+    quantized = matrix.scales is not None
+    threshold = min_similarity - INT8_SCORE_SLACK if quantized else min_similarity
+    wanted = limit * INT8_RERANK_OVERSAMPLE if quantized else limit
+
+    keep = (scores >= threshold) & (matrix.ids != target.id)
+    if is_noun is not None:
+        keep &= matrix.is_noun == is_noun
+    if is_verb is not None:
+        keep &= matrix.is_verb == is_verb
+
+    candidates = np.flatnonzero(keep)
+    if wanted < len(candidates):
+        top = np.argpartition(scores[candidates], -wanted)[-wanted:]
+        candidates = candidates[top]
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    # Only hydrate the winning rows; the int8 rerank needs their embeddings
+    top_ids = matrix.ids[candidates].tolist()
+    queryset = Word.objects.all() if quantized else Word.objects.summaries()
+    words = queryset.in_bulk(top_ids)
+    results = [
+        (words[word_id], float(score))
+        for word_id, score in zip(top_ids, scores[candidates])
+        if word_id in words
+    ]
+
+    if quantized:
+        # Rerank with exact float32 scores, reusing the target vector and
+        # both cached norms
+        results = [
+            (word, float(np.dot(target_embedding, word.get_embedding_array())
+                         / (target_norm * word.get_embedding_norm())))
+            for word, _ in results
+        ]
+        results = [(word, sim) for word, sim in results if sim >= min_similarity]
+        results.sort(key=lambda x: x[1], reverse=True)
+        del results[limit:]
+
+    return results
+
+
 def find_similar_words(
     target_word: str,
     part_of_speech: Optional[str] = None,
@@ -62,9 +620,11 @@ def find_similar_words(
     """
     Find semantically similar words using cosine similarity.
 
-    This function loads the target word's embedding, filters candidate words
-    by part-of-speech if specified, calculates cosine similarity with all
-    candidates using vectorized operations, and returns the top N most similar.
+    This function loads the target word's embedding, scores it against the
+    shared in-memory matrix of normalized embeddings with a single
+    matrix-vector product, filters candidates by part-of-speech if
+    specified, and returns the top N most similar. Results are kept in
+    Django's cache for FINDWORD_SIMILARITY_CACHE_TIMEOUT seconds.
 
     Args:
         target_word: The word to find similarities for.
@@ -92,61 +652,34 @@ def find_similar_words(
     if part_of_speech is not None and part_of_speech not in ['noun', 'verb']:
         raise ValueError("part_of_speech must be 'noun', 'verb', or None")
 
-    # Load target word
-    try:
-        target = Word.objects.get(word=target_word)
-    except Word.DoesNotExist:
-        raise Word.DoesNotExist(f"Word '{target_word}' not found in database")
+    # Results are cached as (id, score) pairs and re-hydrated on a hit
+    timeout = getattr(settings, 'FINDWORD_SIMILARITY_CACHE_TIMEOUT', 0)
+    if timeout:
+        key = results_cache_key(target_word, part_of_speech, limit, min_similarity)
+        cached = cache.get(key)
+        if cached is not None:
+            words = Word.objects.summaries().in_bulk([word_id for word_id, _ in cached])
+            return [(words[word_id], score) for word_id, score in cached if word_id in words]
+
+    # Load target word, ignoring case
+    target = Word.objects.get_word(target_word)
 
     # Get target embedding
     target_embedding = target.get_embedding_array()
-
-    # Build queryset with filters
-    queryset = Word.objects.exclude(id=target.id)
-
-    if part_of_speech == 'noun':
-        queryset = queryset.filter(is_noun=True)
-    elif part_of_speech == 'verb':
-        queryset = queryset.filter(is_verb=True)
-
-    # For better performance with large datasets, we could batch process
-    # For now, we'll process all words (works well for moderate dataset sizes)
-
-    # Precompute normalized target embedding for efficiency
-    target_norm = np.linalg.norm(target_embedding)
-    if target_norm == 0:
+    if not np.any(target_embedding):
         raise ValueError(f"Word '{target_word}' has zero embedding vector")
 
-    target_normalized = target_embedding / target_norm
+    results = rank_similar_words(
+        target,
+        limit=limit,
+        min_similarity=min_similarity,
+        is_noun=True if part_of_speech == 'noun' else None,
+        is_verb=True if part_of_speech == 'verb' else None,
+    )
 
-    # Calculate similarities for all candidate words
-    similar_words = []
-
-    # Batch load embeddings for better performance
-    for word in queryset.iterator(chunk_size=1000):
-        try:
-            # Get candidate embedding
-            candidate_embedding = word.get_embedding_array()
-
-            # Calculate similarity using normalized vectors
-            candidate_norm = np.linalg.norm(candidate_embedding)
-            if candidate_norm == 0:
-                continue
-
-            candidate_normalized = candidate_embedding / candidate_norm
-            similarity = float(np.dot(target_normalized, candidate_normalized))
-
-            # Filter by minimum similarity
-            if similarity >= min_similarity:
-                similar_words.append((word, similarity))
-
-        except (ValueError, TypeError):
-            # Skip words with invalid embeddings
-            continue
-
-    # Sort by similarity (descending) and limit results
-    similar_words.sort(key=lambda x: x[1], reverse=True)
-    return similar_words[:limit]
+    if timeout:
+        cache.set(key, [(word.id, score) for word, score in results], timeout)
+    return results
 
 
 def batch_find_similar_words(
@@ -8,15 +8,35 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import base64
+import io
 import json
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
 import numpy as np
-from django.test import TestCase, Client
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 
+from . import ann, similarity
+from .management.commands import loadwords
+from .management.commands.loadwords import Command as LoadWordsCommand, pack_copy_binary
 from .models import Word
-from .similarity import find_similar_words
+from .serializers import SimilarWordSerializer
+from .similarity import (
+    EmbeddingMatrix, build_matrices, find_similar_words, load_matrices, save_matrices
+)
+from .views import pca_project
 
 
 class WordModelTestCase(TestCase):
@@ -67,6 +87,14 @@ class WordModelTestCase(TestCase):
         self.assertEqual(arr.dtype, np.float32)
         np.testing.assert_array_almost_equal(arr, self.embedding1)
 
+    def test_embedding_stored_as_float32_bytes(self):
+        """Test that embeddings round-trip through the database as float32 bytes."""
+        word = Word.objects.get(pk=self.word1.pk)
+        self.assertEqual(bytes(word.embedding), np.asarray(self.embedding1, dtype='<f4').tobytes())
+        np.testing.assert_array_equal(
+            word.get_embedding_array(), np.asarray(self.embedding1, dtype=np.float32)
+        )
+
     def test_get_embedding_array_invalid(self):
         """Test error handling for invalid embeddings."""
         word = Word.objects.create(
@@ -97,6 +125,19 @@ class WordModelTestCase(TestCase):
         with self.assertRaises(ValueError):
             self.word1.cosine_similarity(word_diff)
 
+    def test_embedding_norm_cached_on_save(self):
+        """Test that the embedding norm is computed when a word is saved."""
+        self.assertAlmostEqual(
+            self.word1.embedding_norm,
+            float(np.linalg.norm(self.embedding1)),
+            places=5
+        )
+
+        self.word1.embedding = [3.0, 4.0, 0.0, 0.0, 0.0]
+        self.word1.save(update_fields=['embedding'])
+        self.word1.refresh_from_db()
+        self.assertAlmostEqual(self.word1.embedding_norm, 5.0, places=5)
+
     def test_cosine_similarity_zero_vector(self):
         """Test cosine similarity with zero vectors."""
         word_zero = Word.objects.create(
@@ -214,12 +255,339 @@ class SimilarityFunctionTestCase(TestCase):
         results = find_similar_words(target_word='dog', limit=1)
         self.assertLessEqual(len(results), 1)
 
+    def test_find_similar_words_scores(self):
+        """Test that results are ranked by exact cosine similarity."""
+        results = find_similar_words(target_word='dog')
+        self.assertEqual([w.word for w, _ in results], ['cat', 'run'])
+        self.assertAlmostEqual(
+            results[0][1], self.word1.cosine_similarity(self.word2), places=5
+        )
+
+    def test_find_similar_words_sees_new_words(self):
+        """Test that saving a word refreshes the shared embedding matrix."""
+        find_similar_words(target_word='dog')
+        Word.objects.create(
+            word='puppy', is_noun=True, is_verb=False, embedding=self.embedding1
+        )
+        results = find_similar_words(target_word='dog', limit=1)
+        self.assertEqual(results[0][0].word, 'puppy')
+
+    def test_matrices_rebuilt_on_new_generation(self):
+        """Test that a results generation bumped elsewhere rebuilds the matrices."""
+        self.addCleanup(similarity.invalidate_matrices)
+        self.assertEqual(len(similarity.get_matrix(5).ids), 3)
+
+        # A bulk write from another process: no signal reaches this one
+        fish = Word(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+        fish.embedding_norm = fish.compute_embedding_norm()
+        Word.objects.bulk_create([fish])
+        self.assertEqual(len(similarity.get_matrix(5).ids), 3)
+
+        cache.set(similarity.RESULTS_GENERATION_KEY, 'elsewhere', None)
+        self.assertEqual(len(similarity.get_matrix(5).ids), 4)
+
+    def test_matrices_rebuilt_on_table_change(self):
+        """Test that a write seen only in the table rebuilds the matrices."""
+        self.addCleanup(similarity.invalidate_matrices)
+        with override_settings(FINDWORD_VERSION_CHECK_INTERVAL=0):
+            self.assertEqual(len(similarity.get_matrix(5).ids), 3)
+
+            # Another worker's write, without a shared cache to announce it
+            fish = Word(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+            fish.embedding_norm = fish.compute_embedding_norm()
+            Word.objects.bulk_create([fish])
+            self.assertEqual(len(similarity.get_matrix(5).ids), 4)
+
+    def test_find_similar_words_cached(self):
+        """Test that a repeated query is answered from the results cache."""
+        with override_settings(FINDWORD_SIMILARITY_CACHE_TIMEOUT=60):
+            first = find_similar_words('dog', limit=2)
+            # Only the hydration query; no target lookup or scan
+            with self.assertNumQueries(1):
+                second = find_similar_words('dog', limit=2)
+        self.assertEqual(second, first)
+
+    def test_int8_matrix_scores(self):
+        """Test that an int8 matrix closely matches float32 scores."""
+        vectors = np.asarray([self.embedding1, self.embedding2, self.embedding3], dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        ids = np.arange(3)
+        flags = np.zeros(3, dtype=bool)
+
+        exact = EmbeddingMatrix.from_float32(ids, vectors, flags, flags)
+        quantized = EmbeddingMatrix.from_float32(ids, vectors, flags, flags, dtype='int8')
+
+        self.assertEqual(quantized.vectors.dtype, np.int8)
+        target = np.asarray(self.embedding1, dtype=np.float32)
+        np.testing.assert_allclose(quantized.scores(target), exact.scores(target), atol=1e-2)
+
+    def test_int8_rerank_hydrates_embeddings(self):
+        """Test that the int8 rerank loads result embeddings in one query."""
+        self.addCleanup(similarity.invalidate_matrices)
+        with override_settings(FINDWORD_MATRIX_DTYPE='int8', FINDWORD_SIMILARITY_CACHE_TIMEOUT=0):
+            similarity.invalidate_matrices()
+            expected = find_similar_words('dog', limit=2)
+            # Target lookup and hydration only
+            with self.assertNumQueries(2):
+                results = find_similar_words('dog', limit=2)
+        self.assertEqual(results, expected)
+        self.assertEqual(results[0][0].word, 'cat')
+
+    def test_matrix_restrict_pos(self):
+        """Test that POS filters score a contiguous view of the matrix."""
+        Word.objects.create(word='walk', is_noun=True, is_verb=True, embedding=self.embedding3)
+        matrix = build_matrices(use_snapshot=False)[5]
+
+        for flags, mask in (({'is_noun': True}, matrix.is_noun), ({'is_verb': True}, matrix.is_verb)):
+            block = matrix.restrict(**flags)
+            self.assertTrue(np.shares_memory(block.vectors, matrix.vectors))
+            self.assertCountEqual(block.ids.tolist(), matrix.ids[mask].tolist())
+
+        # Rows that are not contiguous fall back to the whole matrix
+        flags = np.array([True, False, True])
+        unordered = EmbeddingMatrix(np.arange(3), np.eye(3, dtype=np.float32), flags, ~flags)
+        self.assertIs(unordered.restrict(is_noun=True), unordered)
+
+    def test_matrix_snapshot(self):
+        """Test that a saved matrix snapshot is memory-mapped until the table changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            saved = save_matrices(directory)
+            loaded = load_matrices(directory)
+
+            self.assertIsInstance(loaded[5].vectors, np.memmap)
+            np.testing.assert_array_equal(loaded[5].ids, saved[5].ids)
+            np.testing.assert_array_equal(loaded[5].vectors, saved[5].vectors)
+
+            Word.objects.create(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+            self.assertIsNone(load_matrices(directory))
+
+    def test_matrix_snapshot_resave(self):
+        """Test that saving a new snapshot leaves mapped arrays untouched."""
+        with tempfile.TemporaryDirectory() as directory:
+            save_matrices(directory)
+            mapped = load_matrices(directory)[5]
+            vectors = np.array(mapped.vectors)
+
+            Word.objects.create(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+            save_matrices(directory)
+
+            # The old mapping still reads the old rows, and only the new
+            # snapshot's files remain
+            np.testing.assert_array_equal(mapped.vectors, vectors)
+            self.assertEqual(len(load_matrices(directory)[5].ids), 4)
+            snapshots = [path.name for path in Path(directory).iterdir() if path.is_dir()]
+            self.assertEqual(len(snapshots), 1)
+
     def test_find_similar_words_invalid_pos(self):
         """Test error with invalid POS parameter."""
         with self.assertRaises(ValueError):
             find_similar_words(target_word='dog', part_of_speech='invalid')
 
 
+@unittest.skipUnless(ann.is_available(), "hnswlib is not installed")
+class AnnIndexTestCase(TestCase):
+    """Test cases for the approximate nearest-neighbor index."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.word1 = Word.objects.create(
+            word='dog', is_noun=True, is_verb=False, embedding=[0.1, 0.2, 0.3, 0.4, 0.5]
+        )
+        self.word2 = Word.objects.create(
+            word='cat', is_noun=True, is_verb=False, embedding=[0.15, 0.25, 0.35, 0.45, 0.55]
+        )
+        self.word3 = Word.objects.create(
+            word='run', is_noun=False, is_verb=True, embedding=[0.9, 0.8, 0.7, 0.6, 0.5]
+        )
+
+        # get_index only loads an index saved by loadwords or buildindex
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        settings_override = override_settings(FINDWORD_MATRIX_DIR=self.directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(ann.invalidate_index)
+        ann.save_index(self.directory)
+
+    def test_query_similar_words(self):
+        """Test that index results match exact cosine similarity."""
+        results = ann.query_similar_words(self.word1, limit=2)
+        self.assertEqual([w.word for w, _ in results], ['cat', 'run'])
+        self.assertAlmostEqual(
+            results[0][1], self.word1.cosine_similarity(self.word2), places=4
+        )
+
+    def test_index_not_built_on_request(self):
+        """Test that a stale saved index is dropped, not rebuilt, until saved again."""
+        self.assertEqual(ann.get_index().size, 3)
+
+        Word.objects.create(
+            word='cats', is_noun=True, is_verb=False, embedding=[0.1, 0.2, 0.3, 0.4, 0.6]
+        )
+        with mock.patch.object(ann, 'build_index') as build_index:
+            self.assertIsNone(ann.get_index())
+            self.assertIsNone(ann.query_similar_words(self.word1))
+        build_index.assert_not_called()
+
+        call_command('buildindex', stdout=io.StringIO())
+        self.assertEqual(ann.get_index().size, 4)
+
+    def test_index_reloaded_on_new_save(self):
+        """Test that an index saved by another process replaces the loaded one."""
+        self.assertEqual(ann.get_index().size, 3)
+
+        fish = Word(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+        fish.embedding_norm = fish.compute_embedding_norm()
+        Word.objects.bulk_create([fish])
+        ann.save_index(self.directory)
+        self.assertEqual(ann.get_index().size, 4)
+
+    def test_search_similar_words_filters(self):
+        """Test that filtered index search matches the exact scan."""
+        results = ann.search_similar_words(self.word1, limit=2, is_noun=True)
+        self.assertEqual([w.word for w, _ in results], ['cat'])
+
+        with override_settings(FINDWORD_SIMILARITY_INDEX='hnsw'):
+            hnsw = find_similar_words('dog', part_of_speech='verb')
+        self.assertEqual([w.word for w, _ in hnsw], ['run'])
+
+    def test_saved_index(self):
+        """Test that a saved index is loaded until the table changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            ann.save_index(directory)
+            self.assertEqual(ann.load_index(directory).size, 3)
+
+            Word.objects.create(word='fish', is_noun=True, embedding=[0.5, 0.4, 0.3, 0.2, 0.1])
+            self.assertIsNone(ann.load_index(directory))
+
+            # A new save writes a new file and removes the old one
+            ann.save_index(directory)
+            self.assertEqual(ann.load_index(directory).size, 4)
+            self.assertEqual(len(list(Path(directory).glob(f'{ann.INDEX_PREFIX}*'))), 1)
+
+
+class LoadWordsParseTestCase(TestCase):
+    """Test cases for parsing loadwords CSV rows."""
+
+    def setUp(self):
+        """Set up the command under test."""
+        self.command = LoadWordsCommand()
+        self.embedding = [0.1, -0.2, 0.3]
+
+    def test_parse_json_embedding(self):
+        """Test parsing a JSON array embedding."""
+        row = {'word': 'dog', 'noun': 'Y', 'verb': 'N', 'embd': json.dumps(self.embedding)}
+        data = self.command.parse_csv_row(row)
+        self.assertEqual(data['embedding'].dtype, np.float32)
+        np.testing.assert_allclose(data['embedding'], self.embedding, rtol=1e-6)
+        self.assertTrue(data['is_noun'])
+
+    def test_parse_invalid_json_embedding(self):
+        """Test that malformed or non-numeric JSON embeddings are rejected."""
+        for embd in ('[0.1, 0.2', '["a", "b"]', '[]', '{"a": 1}'):
+            row = {'word': 'dog', 'noun': 'Y', 'verb': 'N', 'embd': embd}
+            with self.assertRaises(ValueError):
+                self.command.parse_csv_row(row)
+
+    def test_parse_base64_embedding(self):
+        """Test parsing a base64 float32 embedding."""
+        embd = base64.b64encode(np.asarray(self.embedding, dtype='<f4').tobytes()).decode('ascii')
+        row = {'word': 'dog', 'noun': 'Y', 'verb': 'N', 'embd': embd}
+        data = self.command.parse_csv_row(row)
+        np.testing.assert_allclose(data['embedding'], self.embedding, rtol=1e-6)
+
+    def test_parse_invalid_base64_embedding(self):
+        """Test that malformed base64 embeddings are rejected."""
+        row = {'word': 'dog', 'noun': 'Y', 'verb': 'N', 'embd': 'not base64!'}
+        with self.assertRaises(ValueError):
+            self.command.parse_csv_row(row)
+
+    def test_read_csv_file_parallel(self):
+        """Test that parsing with --jobs yields the same rows and errors in order."""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write('word,noun,verb,embd\n')
+            for i in range(50):
+                noun = 'X' if i % 10 == 3 else 'Y'
+                f.write(f'w{i},{noun},N,"{json.dumps([0.1, 0.2, i])}"\n')
+        self.addCleanup(os.unlink, f.name)
+
+        def read(jobs):
+            command = LoadWordsCommand()
+            command.stdout = command.stderr = mock.MagicMock()
+            command.error_logger = mock.MagicMock()
+            words = [data['word'] for data in command.read_csv_file(f.name, jobs=jobs)]
+            return words, command.error_logger.error.call_args_list
+
+        with mock.patch.object(loadwords, 'CSV_RANGE_BYTES', 100):
+            serial, parallel = read(1), read(2)
+        self.assertEqual(len(serial[0]), 45)
+        self.assertEqual(parallel, serial)
+        self.assertIn('Line 5:', serial[1][0].args[0])
+
+    def test_load_words_batch_keeps_valid_rows(self):
+        """Test that a failing row costs only itself, not its whole chunk."""
+        self.command.stdout = mock.MagicMock()
+        self.command.error_logger = mock.MagicMock()
+        rows = [
+            {'word': word, 'is_noun': True, 'is_verb': False, 'embedding': self.embedding}
+            for word in ('ant', 'bad', 'cow')
+        ]
+        bulk_create = Word.objects.bulk_create
+
+        def failing_bulk_create(words, **kwargs):
+            if any(word.word == 'bad' for word in words):
+                raise ValueError('bad row')
+            return bulk_create(words, **kwargs)
+
+        with mock.patch.object(Word.objects, 'bulk_create', side_effect=failing_bulk_create):
+            self.command.load_words_batch(rows, chunk_size=3)
+
+        self.assertEqual(sorted(Word.objects.values_list('word', flat=True)), ['ant', 'cow'])
+        self.assertEqual(self.command.stats['created'], 2)
+        self.assertEqual(self.command.stats['errors'], 1)
+        self.assertIn("'bad'", self.command.error_logger.error.call_args.args[0])
+
+    def test_failed_clear_load_keeps_words(self):
+        """Test that --clear is rolled back together with a load that fails."""
+        Word.objects.create(word='dog', is_noun=True, embedding=self.embedding)
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write('word,noun\ncat,Y\n')
+        self.addCleanup(os.unlink, f.name)
+
+        with mock.patch.object(LoadWordsCommand, 'setup_error_logging'), \
+                mock.patch('builtins.input', return_value='yes'):
+            with self.assertRaises(CommandError):
+                call_command('loadwords', '--clear', file=f.name, stdout=io.StringIO())
+
+        self.assertEqual(list(Word.objects.values_list('word', flat=True)), ['dog'])
+
+    def test_pack_copy_binary(self):
+        """Test the PostgreSQL binary COPY encoding of a word."""
+        word = Word(word='café', is_noun=True, is_verb=False, embedding=self.embedding)
+        word.embedding_norm = word.compute_embedding_norm()
+        payload = pack_copy_binary([word])
+
+        self.assertTrue(payload.startswith(b'PGCOPY\n\xff\r\n\x00'))
+        self.assertTrue(payload.endswith(struct.pack('>h', -1)))
+
+        fields, offset = [], 19
+        (count,) = struct.unpack_from('>h', payload, offset)
+        offset += 2
+        for _ in range(count):
+            (length,) = struct.unpack_from('>i', payload, offset)
+            offset += 4
+            fields.append(payload[offset:offset + length])
+            offset += length
+
+        self.assertEqual(fields[0].decode('utf-8'), 'café')
+        self.assertEqual(fields[1:3], [b'\x01', b'\x00'])
+        np.testing.assert_array_equal(
+            np.frombuffer(fields[3], dtype='<f4'), np.asarray(self.embedding, dtype='<f4')
+        )
+        self.assertAlmostEqual(struct.unpack('>d', fields[4])[0], word.embedding_norm)
+
+
 class WordAPITestCase(APITestCase):
     """Test cases for Word API endpoints."""
 
@@ -248,6 +616,52 @@ class WordAPITestCase(APITestCase):
         self.assertIn('results', response.data)
         self.assertGreaterEqual(len(response.data['results']), 3)
 
+    def test_list_words_skips_embeddings(self):
+        """Test listing words does not fetch or serialize embeddings."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/words/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('embedding', response.data['results'][0])
+        for query in queries.captured_queries:
+            self.assertNotIn('"embedding"', query['sql'])
+
+    def test_visualize_cached(self):
+        """Test that visualize plots are cached per projection method."""
+        rng = np.random.default_rng(0)
+        for i in range(6):
+            Word.objects.create(word=f'word{i}', is_noun=True, embedding=rng.random(5).tolist())
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/words/dog/visualize/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        # Neighbor embeddings come from one query, not one per word
+        self.assertLess(len(queries), 8)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get('/api/words/dog/visualize/')
+        self.assertEqual(cached.content, response.content)
+
+        # Clients holding the plot revalidate it without a render
+        self.assertIn('max-age', response['Cache-Control'])
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(
+                '/api/words/dog/visualize/', HTTP_IF_NONE_MATCH=response['ETag']
+            )
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get('/api/words/dog/visualize/?method=tsne')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.content, cached.content)
+
+        response = self.client.get('/api/words/dog/visualize/?output=svg')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        self.assertTrue(response.content.lstrip().startswith(b'<?xml'))
+
+        response = self.client.get('/api/words/dog/visualize/?method=umap')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_retrieve_word(self):
         """Test retrieving a specific word."""
         response = self.client.get('/api/words/dog/')
@@ -256,12 +670,57 @@ class WordAPITestCase(APITestCase):
         self.assertTrue(response.data['is_noun'])
         self.assertFalse(response.data['is_verb'])
 
+    def test_retrieve_word_renders_embedding(self):
+        """Test that the rendered JSON body carries the embedding."""
+        response = self.client.get('/api/words/dog/', HTTP_ACCEPT='application/json')
+        body = json.loads(response.content)
+        self.assertEqual(body['embedding_dimension'], len(body['embedding']))
+        np.testing.assert_allclose(body['embedding'], response.data['embedding'])
+        # float32 values keep their short form instead of widened doubles
+        self.assertIn(b'[0.1,0.2,0.3,0.4,0.5]', response.content.replace(b' ', b''))
+
     def test_retrieve_word_case_insensitive(self):
         """Test case-insensitive word retrieval."""
         response = self.client.get('/api/words/DOG/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['word'].lower(), 'dog')
 
+    def test_visualize_without_similar_words(self):
+        """Test that a word with no neighbors is not plotted alone."""
+        Word.objects.create(word='lonely', embedding=[0.1, 0.2, 0.3])
+        response = self.client.get('/api/words/lonely/visualize/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_pca_project_matches_sklearn(self):
+        """Test the numpy PCA projection against sklearn's."""
+        from sklearn.decomposition import PCA
+
+        embeddings = np.random.default_rng(0).standard_normal((16, 50))
+        np.testing.assert_allclose(
+            pca_project(embeddings, 2), PCA(n_components=2).fit_transform(embeddings), atol=1e-8
+        )
+
+    def test_similar_words_gzipped(self):
+        """Test that JSON responses are compressed for clients that accept it."""
+        for i in range(20):
+            Word.objects.create(word=f'word{i}', is_noun=True, embedding=self.embedding1)
+        response = self.client.get('/api/words/dog/similar/?limit=20', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_retrieve_word_prefers_exact_case(self):
+        """Test that an exact-case match wins over other case variants."""
+        Word.objects.create(word='Dog', is_noun=True, embedding=self.embedding1)
+        self.assertEqual(self.client.get('/api/words/Dog/').data['word'], 'Dog')
+        self.assertEqual(self.client.get('/api/words/dog/').data['word'], 'dog')
+
+    def test_retrieve_word_non_ascii_capital(self):
+        """Test retrieving a word that starts with a non-ASCII capital."""
+        Word.objects.create(word='Époisses', is_noun=True, embedding=self.embedding1)
+        response = self.client.get('/api/words/Époisses/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['word'], 'Époisses')
+
     def test_retrieve_word_not_found(self):
         """Test retrieving non-existent word."""
         response = self.client.get('/api/words/nonexistent/')
@@ -277,6 +736,12 @@ class WordAPITestCase(APITestCase):
             self.assertIn('word', item)
             self.assertIn('similarity', item)
 
+    def test_similar_words_matches_serializer(self):
+        """Test that the similar-words payload matches SimilarWordSerializer."""
+        response = self.client.get('/api/words/dog/similar/')
+        results = [{'word': w, 'similarity': s} for w, s in find_similar_words('dog')]
+        self.assertEqual(response.data, SimilarWordSerializer(results, many=True).data)
+
     def test_similar_words_with_limit(self):
         """Test similar words with limit parameter."""
         response = self.client.get('/api/words/dog/similar/?limit=1')
@@ -342,6 +807,27 @@ class SearchAPITestCase(APITestCase):
         self.assertIn('dogma', words)
         self.assertNotIn('cat', words)
 
+    def test_search_punctuated_prefix(self):
+        """Test prefix search keeps words whose prefix ends in punctuation."""
+        for text in ('dog-eared', 'dog-tired', 'dogz', 'dog.com'):
+            Word.objects.create(word=text, is_noun=True, embedding=self.embedding)
+
+        response = self.client.get('/api/search/?q=Dog-')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        words = [item['word'] for item in response.data['results']]
+        self.assertEqual(words, ['dog-eared', 'dog-tired'])
+
+    def test_search_non_ascii_capital(self):
+        """Test exact and prefix search for a word with a non-ASCII capital."""
+        Word.objects.create(word='Époisses', is_noun=True, embedding=self.embedding)
+        for params in ('q=Époisses&exact=true', 'q=Épo'):
+            # The page count and the page; the query is lowered in SQL
+            with self.assertNumQueries(2):
+                response = self.client.get(f'/api/search/?{params}')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            words = [item['word'] for item in response.data['results']]
+            self.assertEqual(words, ['Époisses'])
+
     def test_search_exact_match(self):
         """Test exact match search."""
         response = self.client.get('/api/search/?q=dog&exact=true')
@@ -398,6 +884,15 @@ class IndexViewTestCase(TestCase):
         self.assertIn('searchBtn', content)
         self.assertIn('visualizeBtn', content)
 
+    def test_index_page_not_modified(self):
+        """Test that a request with the current ETag gets a 304."""
+        response = self.client.get('/')
+        etag = response['ETag']
+
+        response = self.client.get('/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
 
 class APIRootTestCase(APITestCase):
     """Test cases for the API root endpoint."""
@@ -408,3 +903,23 @@ class APIRootTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
         self.assertIn('endpoints', response.data)
+
+    def test_api_root_cached_per_accept(self):
+        """Test the cached API root keeps JSON and HTML renderings apart."""
+        for _ in range(2):
+            response = self.client.get('/api/', HTTP_ACCEPT='application/json')
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertIn('Accept', response['Vary'])
+
+        response = self.client.get('/api/', HTTP_ACCEPT='text/html')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+
+    def test_api_root_html_not_cached_across_users(self):
+        """Test a logged-in user's browsable API root is not served to others."""
+        admin = get_user_model().objects.create_superuser('rootadmin', 'admin@example.com', 'pw')
+        self.client.force_login(admin)
+        response = self.client.get('/api/', HTTP_ACCEPT='text/html')
+        self.assertContains(response, 'rootadmin')
+
+        response = APIClient().get('/api/', HTTP_ACCEPT='text/html')
+        self.assertNotContains(response, 'rootadmin')
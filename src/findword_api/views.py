@@ -9,13 +9,24 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
-from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
+import functools
+import hashlib
 import io
+from typing import Tuple
 import numpy as np
 
+from .fields import embeddings_to_matrix
 from .models import Word
 from .serializers import (
     WordSerializer,
@@ -23,8 +34,67 @@ from .serializers import (
     SimilarWordSerializer,
     SimilaritySearchSerializer,
     WordSearchSerializer,
+    similar_words_payload,
 )
-from .similarity import find_similar_words
+from .similarity import find_similar_words, results_generation
+
+# Seconds browsers may reuse the index page before revalidating its ETag
+INDEX_MAX_AGE = 300
+
+# Seconds the constant JSON API root is kept in the server-side cache
+API_ROOT_CACHE_TIMEOUT = 3600
+
+# Resolution of visualize plots; the 12x10 inch figure is 960x800 pixels
+VISUALIZE_DPI = 80
+
+# visualize point colors by (is_noun, is_verb); nouns win over verbs
+POS_COLORS = {
+    (True, False): '#667eea',  # Blue for nouns
+    (True, True): '#667eea',
+    (False, True): '#764ba2',  # Purple for verbs
+    (False, False): '#999',  # Gray for others
+}
+
+# Seconds clients may reuse a visualize plot before revalidating its ETag
+VISUALIZE_MAX_AGE = 3600
+
+# Content types of the visualize output formats
+VISUALIZE_FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+
+
+def pca_project(embeddings: np.ndarray, n_components: int) -> np.ndarray:
+    """
+    Project rows onto their top principal components.
+
+    Gives the same result as sklearn's PCA(n_components).fit_transform,
+    including its sign convention, from one small SVD and without the
+    cost of importing sklearn.
+
+    Args:
+        embeddings: Row vectors, shape (N, D).
+        n_components: Number of components, at most min(N, D).
+
+    Returns:
+        np.ndarray: Projected rows, shape (N, n_components).
+    """
+    centered = embeddings - embeddings.mean(axis=0)
+    _, _, vt = np.linalg.svd(centered, full_matrices=False)
+    components = vt[:n_components]
+    # Flip each component so that its largest loading is positive
+    largest = np.abs(components).argmax(axis=1)
+    components *= np.sign(components[np.arange(len(components)), largest])[:, None]
+    return centered @ components.T
+
+
+def visualization_response(content: bytes, output_format: str, etag: str) -> HttpResponse:
+    """Wrap a rendered plot in a response that clients may cache."""
+    response = HttpResponse(content, content_type=VISUALIZE_FORMATS[output_format])
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=VISUALIZE_MAX_AGE)
+    return response
 
 
 class WordViewSet(viewsets.ReadOnlyModelViewSet):
@@ -48,6 +118,24 @@ class WordViewSet(viewsets.ReadOnlyModelViewSet):
             return SimilarWordSerializer
         return WordListSerializer
 
+    def get_object(self):
+        """Look the word up ignoring case, preferring an exact-case match."""
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            obj = queryset.get_word(self.kwargs[self.lookup_field])
+        except Word.DoesNotExist:
+            raise Http404(f"Word '{self.kwargs[self.lookup_field]}' not found in database")
+
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def get_queryset(self):
+        """Skip loading embeddings for the list, which does not show them."""
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.summaries()
+        return queryset
+
     @extend_schema(
         summary="List all words",
         description="Get paginated list of all words in the database",
@@ -173,19 +261,12 @@ class WordViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Format response
-        results = [
-            {'word': w, 'similarity': sim}
-            for w, sim in similar_words
-        ]
-
-        # Serialize and return
-        serializer = SimilarWordSerializer(results, many=True)
-        return Response(serializer.data)
+        # Same shape as SimilarWordSerializer, without its per-field overhead
+        return Response(similar_words_payload(similar_words))
 
     @extend_schema(
         summary="Visualize word semantic space",
-        description="Generate a t-SNE visualization of the semantic space around a target word",
+        description="Generate a 2-D PCA or t-SNE visualization of the semantic space around a target word",
         parameters=[
             OpenApiParameter(
                 name='limit',
@@ -194,23 +275,41 @@ class WordViewSet(viewsets.ReadOnlyModelViewSet):
                 description="Number of similar words to include in visualization (default: 15, max: 50)",
                 required=False,
             ),
+            OpenApiParameter(
+                name='method',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Projection to 2-D: 'pca' (default) or the slower 'tsne'",
+                required=False,
+                enum=['pca', 'tsne'],
+            ),
+            OpenApiParameter(
+                name='output',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Image format: 'png' (default) or the smaller, faster 'svg'",
+                required=False,
+                enum=['png', 'svg'],
+            ),
         ],
         responses={
             200: {
-                'description': 'PNG image of the t-SNE visualization',
-                'content': {'image/png': {}},
+                'description': 'PNG or SVG image of the visualization',
+                'content': {content_type: {} for content_type in VISUALIZE_FORMATS.values()},
             },
-            404: {"description": "Word not found"},
+            404: {"description": "Word not found or has no similar words"},
             400: {"description": "Invalid parameters or visualization error"},
         },
     )
     @action(detail=True, methods=['get'], url_path='visualize')
     def visualize(self, request, *args, **kwargs):
         """
-        Generate a t-SNE visualization of the word and its similar words.
+        Generate a 2-D visualization of the word and its similar words.
 
         Query parameters:
         - limit: Number of similar words to include (default: 15, max: 50)
+        - method: 'pca' (default) or 'tsne'
+        - output: 'png' (default) or 'svg'
         """
         try:
             # Get the word from the URL parameter
@@ -223,66 +322,105 @@ class WordViewSet(viewsets.ReadOnlyModelViewSet):
             except (ValueError, TypeError):
                 limit = 15
 
+            method = request.query_params.get('method', 'pca')
+            if method not in ('pca', 'tsne'):
+                return Response(
+                    {'error': "method must be 'pca' or 'tsne'"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Not ?format=, which DRF reserves for picking a renderer
+            output_format = request.query_params.get('output', 'png')
+            if output_format not in VISUALIZE_FORMATS:
+                return Response(
+                    {'error': "output must be 'png' or 'svg'"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Rendered plots, and their ETags, change only with the Word table
+            version = f"{results_generation()}:{word}:{limit}:{method}:{output_format}"
+            etag = quote_etag(hashlib.sha256(version.encode()).hexdigest()[:32])
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                patch_cache_control(not_modified, public=True, max_age=VISUALIZE_MAX_AGE)
+                return not_modified
+
+            timeout = getattr(settings, 'FINDWORD_VISUALIZE_CACHE_TIMEOUT', 0)
+            key = f"findword:visualize:{version}"
+            if timeout:
+                content = cache.get(key)
+                if content is not None:
+                    return visualization_response(content, output_format, etag)
+
             # Get the target word
-            target_word = Word.objects.get(word__iexact=word)
+            target_word = Word.objects.get_word(word)
 
             # Find similar words
             similar_words = target_word.get_similar_words(limit=limit)
+            if not similar_words:
+                return Response(
+                    {'error': f"Word '{word}' has no similar words to visualize"},
+                    status=status.HTTP_404_NOT_FOUND
+                )
 
-            # Collect embeddings for visualization
+            # Collect embeddings for visualization; similar words are loaded
+            # without them, so stack the raw bytes of all rows from one query
             words_to_plot = [target_word] + [w for w, _ in similar_words]
-            embeddings = np.array([w.get_embedding_array() for w in words_to_plot])
-
-            # Apply PCA for dimensionality reduction
-            try:
-                from sklearn.decomposition import PCA
+            ids = [w.id for w in words_to_plot]
+            rows = dict(Word.objects.filter(id__in=ids).values_list('id', 'embedding'))
+            embeddings = embeddings_to_matrix(
+                [rows[word_id] for word_id in ids], target_word.get_embedding_array().size
+            )
 
+            if method == 'pca':
+                # At a few dozen points a 2-D PCA already shows the
+                # neighborhood, without t-SNE's optimization cost
+                embeddings_2d = pca_project(embeddings, 2)
+            else:
                 # Reduce to reasonable dimensions before t-SNE
-                pca = PCA(n_components=min(8, embeddings.shape[1]))
-                embeddings_reduced = pca.fit_transform(embeddings)
-            except ImportError:
-                embeddings_reduced = embeddings
-
-            # Apply t-SNE for 2D visualization
-            try:
-                from sklearn.manifold import TSNE
-
-                tsne = TSNE(
-                    n_components=2,
-                    random_state=42,
-                    perplexity=min(30, len(words_to_plot) - 1),
-                )
-                embeddings_2d = tsne.fit_transform(embeddings_reduced)
-            except ImportError:
-                # Fallback: just use PCA if t-SNE not available
-                from sklearn.decomposition import PCA
-                pca = PCA(n_components=2)
-                embeddings_2d = pca.fit_transform(embeddings_reduced)
+                embeddings_reduced = pca_project(embeddings, min(8, *embeddings.shape))
+
+                # Prefer the multi-threaded openTSNE implementation when it
+                # is installed
+                perplexity = min(30, len(words_to_plot) - 1)
+                try:
+                    from openTSNE import TSNE as OpenTSNE
+                except ImportError:
+                    OpenTSNE = None
+                if OpenTSNE is not None:
+                    # Barnes-Hut beats FFT interpolation at a few dozen points
+                    tsne = OpenTSNE(
+                        n_components=2,
+                        perplexity=perplexity,
+                        negative_gradient_method='bh',
+                        n_jobs=-1,
+                        random_state=42,
+                    )
+                    embeddings_2d = np.asarray(tsne.fit(embeddings_reduced.astype(np.float32)))
+                else:
+                    from sklearn.manifold import TSNE
+
+                    tsne = TSNE(
+                        n_components=2,
+                        random_state=42,
+                        perplexity=perplexity,
+                    )
+                    embeddings_2d = tsne.fit_transform(embeddings_reduced)
 
             # Create visualization
             try:
-                import matplotlib
-                matplotlib.use('Agg')  # Use non-interactive backend
-                import matplotlib.pyplot as plt
-
-                fig, ax = plt.subplots(figsize=(12, 10), dpi=100)
-
-                # Plot similar words
-                for i in range(1, len(embeddings_2d)):
-                    x, y = embeddings_2d[i]
-                    word_obj = words_to_plot[i]
-                    pos = ['noun' if word_obj.is_noun else '', 'verb' if word_obj.is_verb else '']
-                    pos = ' '.join(filter(bool, pos)) or 'other'
-
-                    # Color based on part of speech
-                    if word_obj.is_noun:
-                        color = '#667eea'  # Blue for nouns
-                    elif word_obj.is_verb:
-                        color = '#764ba2'  # Purple for verbs
-                    else:
-                        color = '#999'  # Gray for others
-
-                    ax.scatter(x, y, s=300, alpha=0.7, color=color)
+                # A standalone Figure renders with Agg without going through
+                # pyplot's global figure manager, which is much cheaper
+                from matplotlib.figure import Figure
+
+                fig = Figure(figsize=(12, 10), dpi=VISUALIZE_DPI)
+                ax = fig.add_subplot()
+
+                # Plot similar words in one scatter, colored by part of speech
+                similar_2d = embeddings_2d[1:]
+                colors = [POS_COLORS[(w.is_noun, w.is_verb)] for w in words_to_plot[1:]]
+                ax.scatter(similar_2d[:, 0], similar_2d[:, 1], s=300, alpha=0.7, c=colors)
+                for word_obj, (x, y) in zip(words_to_plot[1:], similar_2d):
                     ax.annotate(word_obj.word, (x, y), fontsize=9, ha='center', va='center')
 
                 # Plot target word (larger)
@@ -309,14 +447,15 @@ class WordViewSet(viewsets.ReadOnlyModelViewSet):
                 ]
                 ax.legend(handles=legend_elements, loc='best', fontsize=10)
 
-                # Save to buffer
+                # Save to buffer; SVG skips rasterizing this sparse scene
                 buf = io.BytesIO()
-                plt.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-                buf.seek(0)
-                plt.close(fig)
+                fig.savefig(buf, format=output_format)
 
                 # Return as image
-                return HttpResponse(buf.getvalue(), content_type='image/png')
+                content = buf.getvalue()
+                if timeout:
+                    cache.set(key, content, timeout)
+                return visualization_response(content, output_format, etag)
 
             except ImportError:
                 return Response(
@@ -397,11 +536,12 @@ def search_words(request):
     part_of_speech = params.get('part_of_speech')
     exact = params.get('exact', False)
 
-    # Build queryset
+    # Filter on LOWER(word) so word_lower_idx can serve it
+    queryset = Word.objects.summaries()
     if exact:
-        queryset = Word.objects.filter(word__iexact=query)
+        queryset = queryset.matching(query)
     else:
-        queryset = Word.objects.filter(word__istartswith=query)
+        queryset = queryset.prefixed(query)
 
     # Apply part of speech filter
     if part_of_speech == 'noun':
@@ -423,16 +563,23 @@ def search_words(request):
     return paginator.get_paginated_response(serializer.data)
 
 
+@cache_page(API_ROOT_CACHE_TIMEOUT)
 @extend_schema(
     summary="API Root",
     description="Root endpoint providing links to all available API endpoints",
 )
+@vary_on_headers('Accept')
 @api_view(['GET'])
 def api_root(request):
     """
     API root endpoint providing overview and links.
+
+    The JSON response never changes, so it is served from the cache; it
+    varies on Accept to keep the JSON and browsable renderings apart. The
+    browsable page shows the logged-in user and a CSRF token, so it is
+    marked private, which keeps cache_page from storing it.
     """
-    return Response({
+    response = Response({
         'message': 'Welcome to the FindWord API',
         'version': '1.0.0',
         'endpoints': {
@@ -443,13 +590,42 @@ def api_root(request):
         },
         'documentation': 'Visit /api/docs/ for interactive API documentation',
     })
+    if request.accepted_renderer.format != 'json':
+        patch_cache_control(response, private=True)
+    return response
+
+
+@functools.lru_cache(maxsize=None)
+def render_index_page() -> Tuple[bytes, str]:
+    """
+    Render the index template once per process.
+
+    The page has no per-request context, so its HTML and ETag never change
+    while the process runs.
+
+    Returns:
+        Tuple of (HTML bytes, ETag).
+    """
+    content = render_to_string('findword_api/index.html').encode()
+    return content, hashlib.sha256(content).hexdigest()[:32]
+
+
+def index_etag(request) -> str:
+    """Return the ETag of the index page, re-rendering it in DEBUG."""
+    if settings.DEBUG:
+        render_index_page.cache_clear()
+    return render_index_page()[1]
 
 
+@condition(etag_func=index_etag)
 def index(request):
     """
     Render the main FindWord web interface.
 
     GET /:
         Returns HTML page with search interface and visualization features.
+        Clients that send the current ETag get an empty 304 instead.
     """
-    return render(request, 'findword_api/index.html')
+    response = HttpResponse(render_index_page()[0])
+    patch_cache_control(response, public=True, max_age=INDEX_MAX_AGE)
+    return response
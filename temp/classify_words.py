@@ -19,13 +19,21 @@ Author: Claude
 """
 
 import argparse
-import re
+import os
 from pathlib import Path
-from typing import Dict, Set, Tuple
-from collections import defaultdict
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+# Parts of speech that words are classified by, with the bit each one sets
+# in a word's POS mask
+POS_BITS = {'noun': 1, 'verb': 2}
+
+# Threads used to read word files concurrently
+READ_WORKERS = 8
+
 
 def parse_filename(filename: str) -> Tuple[str, str, int]:
     """
@@ -41,38 +49,33 @@ def parse_filename(filename: str) -> Tuple[str, str, int]:
         >>> parse_filename("pos=noun,lang=en,length=3.txt")
         ('noun', 'en', 3)
     """
-    pattern = r"pos=(\w+),lang=(\w+),length=(\d+)\.txt"
-    match = re.match(pattern, filename)
+    # The format is fixed, so plain string splitting is enough
+    stem, _, ext = filename.rpartition('.')
+    fields = [field.partition('=') for field in stem.split(',')]
 
-    if not match:
+    if ext != 'txt' or [key for key, _, _ in fields] != ['pos', 'lang', 'length']:
         raise ValueError(f"Invalid filename format: {filename}")
 
-    pos, lang, length = match.groups()
+    (_, _, pos), (_, _, lang), (_, _, length) = fields
+    if not (pos and lang and length.isdecimal()):
+        raise ValueError(f"Invalid filename format: {filename}")
     return pos, lang, int(length)
 
 
-def extract_word_from_line(line: str) -> str:
+def read_lines(filepath: Path) -> List[str]:
     """
-    Extract the word from a line in format "word: definition".
+    Read a word file and split it into lines.
 
     Args:
-        line: A line from the word file
+        filepath: Path to the word file
 
     Returns:
-        The word (lowercase, stripped)
-
-    Example:
-        >>> extract_word_from_line("run: To move quickly on foot")
-        'run'
+        The file's lines, without line endings
     """
-    if ':' not in line:
-        return None
-
-    word = line.split(':', 1)[0].strip().lower()
-    return word if word else None
+    return filepath.read_text(encoding='utf-8').splitlines()
 
 
-def process_word_files(input_dir: Path) -> Dict[str, Set[str]]:
+def process_word_files(input_dir: Path) -> Dict[str, int]:
     """
     Process all word files and track which parts of speech each word appears in.
 
@@ -80,65 +83,75 @@ def process_word_files(input_dir: Path) -> Dict[str, Set[str]]:
         input_dir: Directory containing word files
 
     Returns:
-        Dictionary mapping each word to a set of parts of speech it can be
+        Dictionary mapping each word to a POS_BITS mask of the parts of
+        speech it can be
     """
-    word_pos_map = defaultdict(set)
-
-    # Get all .txt files in the directory
-    word_files = sorted(input_dir.glob("*.txt"))
+    # Only English noun and verb files are used, and their names say so,
+    # so other files are never stat'ed or opened. One scandir pass lists
+    # the directory; only the names are parsed.
+    with os.scandir(input_dir) as entries:
+        names = sorted(entry.name for entry in entries if entry.name.endswith('.txt'))
+
+    word_files = []
+    for name in names:
+        try:
+            pos, lang, _ = parse_filename(name)
+        except ValueError as e:
+            print(f"Warning: {e}")
+            continue
+        if lang == 'en' and pos in POS_BITS:
+            word_files.append((pos, input_dir / name))
 
     if not word_files:
         raise FileNotFoundError(f"No word files found in {input_dir}")
 
     print(f"Found {len(word_files)} word files to process")
 
-    for filepath in tqdm(word_files, desc="Processing files"):
-        # Skip empty files
-        if filepath.stat().st_size == 0:
-            continue
+    # Words seen in the files of each part of speech
+    pos_words = {pos: set() for pos in POS_BITS}
 
-        try:
-            pos, lang, length = parse_filename(filepath.name)
-        except ValueError as e:
-            print(f"Warning: {e}")
-            continue
+    # Overlap the many small file reads in threads; words are merged here
+    # on the main thread so the sets need no locking
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        file_lines = executor.map(read_lines, (filepath for _, filepath in word_files))
+        for (pos, _), lines in tqdm(zip(word_files, file_lines), total=len(word_files),
+                                    desc="Processing files"):
+            # Each definition line is "word: definition"; words are lowercased
+            pos_words[pos].update(
+                line.split(':', 1)[0].strip().lower() for line in lines if ':' in line
+            )
 
-        # Only process English words and noun/verb classifications
-        if lang != 'en' or pos not in ['noun', 'verb']:
-            continue
+    # Combine the sets with C-level set operations rather than a per-word update
+    nouns = pos_words['noun']
+    verbs = pos_words['verb']
+    word_pos_map = dict.fromkeys(nouns - verbs, POS_BITS['noun'])
+    word_pos_map.update(dict.fromkeys(verbs - nouns, POS_BITS['verb']))
+    word_pos_map.update(dict.fromkeys(nouns & verbs, POS_BITS['noun'] | POS_BITS['verb']))
+    word_pos_map.pop('', None)
 
-        # Read and process the file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                word = extract_word_from_line(line.strip())
-                if word:
-                    word_pos_map[word].add(pos)
+    return word_pos_map
 
-    return dict(word_pos_map)
 
-
-def classify_words(word_pos_map: Dict[str, Set[str]]) -> pd.DataFrame:
+def classify_words(word_pos_map: Dict[str, int]) -> pd.DataFrame:
     """
     Convert word-to-POS mapping into a classified DataFrame.
 
     Args:
-        word_pos_map: Dictionary mapping words to their parts of speech
+        word_pos_map: Dictionary mapping words to their POS_BITS masks
 
     Returns:
-        DataFrame with columns: word, noun, verb
+        DataFrame with columns: word, noun, verb, sorted by word
     """
-    records = []
-
-    for word in tqdm(sorted(word_pos_map.keys()), desc="Classifying words"):
-        pos_set = word_pos_map[word]
-
-        records.append({
-            'word': word,
-            'noun': 'Y' if 'noun' in pos_set else 'N',
-            'verb': 'Y' if 'verb' in pos_set else 'N'
-        })
+    words = np.fromiter(word_pos_map.keys(), dtype=object, count=len(word_pos_map))
+    pos_masks = np.fromiter(word_pos_map.values(), dtype=np.int8, count=len(word_pos_map))
 
-    return pd.DataFrame(records)
+    df = pd.DataFrame({
+        'word': words,
+        'noun': np.where(pos_masks & POS_BITS['noun'], 'Y', 'N'),
+        'verb': np.where(pos_masks & POS_BITS['verb'], 'Y', 'N'),
+    })
+    # Sort once over the word column instead of sorting the dict items
+    return df.sort_values('word', kind='stable', ignore_index=True)
 
 
 def print_statistics(df: pd.DataFrame) -> None:
@@ -148,10 +161,19 @@ def print_statistics(df: pd.DataFrame) -> None:
     Args:
         df: DataFrame with classified words
     """
+    # Pack each row back into its POS_BITS mask and count all masks in one pass
+    noun_bit, verb_bit = POS_BITS['noun'], POS_BITS['verb']
+    both_mask = noun_bit | verb_bit
+    pos_masks = (
+        (df['noun'].to_numpy() == 'Y').astype(np.uint8) * noun_bit
+        | (df['verb'].to_numpy() == 'Y').astype(np.uint8) * verb_bit
+    )
+    counts = np.bincount(pos_masks, minlength=both_mask + 1)
+
     total_words = len(df)
-    nouns_only = len(df[(df['noun'] == 'Y') & (df['verb'] == 'N')])
-    verbs_only = len(df[(df['noun'] == 'N') & (df['verb'] == 'Y')])
-    both = len(df[(df['noun'] == 'Y') & (df['verb'] == 'Y')])
+    nouns_only = int(counts[noun_bit])
+    verbs_only = int(counts[verb_bit])
+    both = int(counts[both_mask])
 
     print("\n" + "="*60)
     print("WORD CLASSIFICATION STATISTICS")
@@ -163,10 +185,10 @@ def print_statistics(df: pd.DataFrame) -> None:
     print("="*60)
 
     # Print sample words that are both noun and verb
-    both_words = df[(df['noun'] == 'Y') & (df['verb'] == 'Y')]['word'].tolist()
-    if both_words:
+    both_words = df['word'].to_numpy()[pos_masks == both_mask][:20]
+    if len(both_words):
         print(f"\nSample words that are both noun and verb (first 20):")
-        print(", ".join(both_words[:20]))
+        print(", ".join(both_words))
 
     print()
 
@@ -15,7 +15,6 @@ Formats:
 """
 
 import os
-import re
 import json
 import csv
 import argparse
@@ -36,6 +35,7 @@ class WordListExtractor:
         self.source_dir = Path(source_dir)
         self.words_by_pos = defaultdict(lambda: defaultdict(set))
         self.all_words = set()
+        self._sorted_words = None
 
     def parse_filename(self, filename):
         """
@@ -47,9 +47,14 @@ class WordListExtractor:
         Returns:
             dict with 'pos', 'lang', and 'length' keys, or None if invalid
         """
-        match = re.match(r'pos=(\w+),lang=(\w+),length=(\d+)\.txt', filename)
-        if match:
-            pos, lang, length = match.groups()
+        # The format is fixed, so plain string splitting is enough
+        stem, _, ext = filename.rpartition('.')
+        fields = [field.partition('=') for field in stem.split(',')]
+        if ext != 'txt' or [key for key, _, _ in fields] != ['pos', 'lang', 'length']:
+            return None
+
+        (_, _, pos), (_, _, lang), (_, _, length) = fields
+        if pos and lang and length.isdecimal():
             return {
                 'pos': pos,
                 'lang': lang,
@@ -57,22 +62,6 @@ class WordListExtractor:
             }
         return None
 
-    def extract_word_from_line(self, line):
-        """
-        Extract the word from a definition line.
-
-        Args:
-            line: Line containing "word: definition"
-
-        Returns:
-            The word (before the colon), or None if invalid
-        """
-        line = line.strip()
-        if ':' in line:
-            word = line.split(':', 1)[0].strip()
-            return word
-        return None
-
     def load_file(self, filepath):
         """
         Load words from a single file.
@@ -83,15 +72,14 @@ class WordListExtractor:
         Returns:
             set of words found in the file
         """
-        words = set()
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    word = self.extract_word_from_line(line)
-                    if word:
-                        words.add(word)
+            lines = filepath.read_text(encoding='utf-8').splitlines()
         except Exception as e:
             print(f"Error reading {filepath}: {e}")
+            return set()
+        # Each definition line is "word: definition"
+        words = {line.split(':', 1)[0].strip() for line in lines if ':' in line}
+        words.discard('')
         return words
 
     def load_all_files(self):
@@ -99,9 +87,16 @@ class WordListExtractor:
         if not self.source_dir.exists():
             raise FileNotFoundError(f"Source directory not found: {self.source_dir}")
 
+        self._sorted_words = None
         files_processed = 0
-        for filepath in sorted(self.source_dir.glob('*.txt')):
-            metadata = self.parse_filename(filepath.name)
+        # List the directory in one scandir pass; parse_filename rejects
+        # any .txt file that is not a word list
+        with os.scandir(self.source_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith('.txt'))
+
+        for name in names:
+            filepath = self.source_dir / name
+            metadata = self.parse_filename(name)
             if metadata:
                 words = self.load_file(filepath)
                 if words:
@@ -132,6 +127,24 @@ class WordListExtractor:
 
         return stats
 
+    def sorted_words(self):
+        """
+        Get each word list sorted, sorting every (pos, length) set only once.
+
+        The result is cached so that all exports share the same sort.
+
+        Returns:
+            dict mapping (pos, length) to a sorted list of words, in
+            words_by_pos order
+        """
+        if self._sorted_words is None:
+            self._sorted_words = {
+                (pos, length): sorted(words)
+                for pos, lengths in self.words_by_pos.items()
+                for length, words in lengths.items()
+            }
+        return self._sorted_words
+
     def export_to_json(self, output_path):
         """
         Export words to JSON format with metadata.
@@ -148,10 +161,8 @@ class WordListExtractor:
             'words': {}
         }
 
-        for pos, lengths in self.words_by_pos.items():
-            data['words'][pos] = {}
-            for length, words in lengths.items():
-                data['words'][pos][str(length)] = sorted(words)
+        for (pos, length), words in self.sorted_words().items():
+            data['words'].setdefault(pos, {})[str(length)] = words
 
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
@@ -179,16 +190,15 @@ class WordListExtractor:
             output_path: Path to write the CSV file
         """
         rows = []
-        for pos, lengths in self.words_by_pos.items():
-            for length, words in lengths.items():
-                for word in sorted(words):
-                    rows.append({
-                        'word': word,
-                        'pos': pos,
-                        'length': length
-                    })
-
-        # Sort by word
+        for (pos, length), words in self.sorted_words().items():
+            for word in words:
+                rows.append({
+                    'word': word,
+                    'pos': pos,
+                    'length': length
+                })
+
+        # Sort by word; the runs are already sorted, which the sort exploits
         rows.sort(key=lambda x: x['word'])
 
         with open(output_path, 'w', encoding='utf-8', newline='') as f:
@@ -209,13 +219,12 @@ class WordListExtractor:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         for pos, lengths in self.words_by_pos.items():
-            all_pos_words = set()
-            for words in lengths.values():
-                all_pos_words.update(words)
+            # Union and sort in C rather than merging the sorted lists in Python
+            all_pos_words = sorted(set().union(*lengths.values()))
 
             output_path = output_dir / f"{pos}.txt"
             with open(output_path, 'w', encoding='utf-8') as f:
-                for word in sorted(all_pos_words):
+                for word in all_pos_words:
                     f.write(f"{word}\n")
 
             print(f"Exported {len(all_pos_words)} {pos}s to {output_path}")
@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --isolated --no-project --script
 # /// script
-# dependencies = ["gensim>=4.0.0", "numpy", "pandas", "tqdm"]
+# dependencies = ["gensim>=4.0.0", "numpy", "pandas", "pyarrow", "tqdm"]
 # ///
 
 """
@@ -8,7 +8,7 @@ Generate FastText embeddings for classified words.
 
 This script reads classified words from a CSV file, generates FastText embeddings
 for each word using a pre-trained model, and outputs the results with embeddings
-stored as JSON arrays.
+stored as base64-encoded float32 bytes (or JSON arrays with --embedding-format json).
 
 Features:
 - Batch processing for memory efficiency
@@ -19,10 +19,12 @@ Features:
 """
 
 import argparse
+import base64
+import csv
 import json
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -34,13 +36,18 @@ except ImportError:
     print("Error: gensim package not found", file=sys.stderr)
     sys.exit(1)
 
+# The .kv cache loader is shared with the play scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "play"))
+from fasttext_model import load_keyed_vectors
 
-def load_fasttext_model(model_path: Path) -> KeyedVectors:
+
+def load_fasttext_model(model_path: Path, use_cache: bool = True) -> KeyedVectors:
     """
     Load FastText model from the specified file.
 
     Args:
         model_path: Path to the .vec model file
+        use_cache: Whether to read/write the memory-mapped .kv cache
 
     Returns:
         Loaded FastText model as KeyedVectors
@@ -55,11 +62,8 @@ def load_fasttext_model(model_path: Path) -> KeyedVectors:
             "Please ensure the FastText model is downloaded."
         )
 
-    print(f"Loading FastText model from: {model_path}")
-    print("This may take a few moments...")
-
     try:
-        model = KeyedVectors.load_word2vec_format(str(model_path))
+        model = load_keyed_vectors(model_path, use_cache)
         print(f"Model loaded successfully!")
         print(f"Model vocabulary size: {len(model):,}")
         print(f"Embedding dimension: {model.vector_size}")
@@ -88,7 +92,8 @@ def load_classified_words(input_path: Path) -> pd.DataFrame:
     print(f"\nLoading classified words from: {input_path}")
 
     try:
-        df = pd.read_csv(input_path)
+        # pyarrow parses the file on several threads into arrow-backed columns
+        df = pd.read_csv(input_path, engine="pyarrow", dtype_backend="pyarrow")
 
         # Validate columns
         required_columns = {"word", "noun", "verb"}
@@ -105,27 +110,27 @@ def load_classified_words(input_path: Path) -> pd.DataFrame:
         raise ValueError(f"Failed to load input file: {e}")
 
 
-def get_embedding(word: str, model: KeyedVectors) -> Optional[np.ndarray]:
+def lookup_vocab_indices(words: np.ndarray, model: KeyedVectors) -> np.ndarray:
     """
-    Get FastText embedding for a word.
+    Find the rows of model.vectors holding the embeddings of a batch of words.
 
     Args:
-        word: The word to embed
+        words: Array of words to embed
         model: Loaded FastText model
 
     Returns:
-        Numpy array of embedding values, or None if word not in vocabulary
+        Array of row indices, -1 where the word is not in the vocabulary
+        (or is not a non-blank string, e.g. NaN from an empty cell)
     """
-    try:
-        # Ensure word is a string and handle special cases
-        if not isinstance(word, str) or not word.strip():
-            return None
-        return model[word]
-    except (KeyError, TypeError, ValueError):
-        # KeyError: word not in vocabulary
-        # TypeError: word format incompatible
-        # ValueError: other gensim errors
-        return None
+    key_to_index = model.key_to_index
+    return np.fromiter(
+        (
+            key_to_index.get(word, -1) if isinstance(word, str) and word.strip() else -1
+            for word in words
+        ),
+        dtype=np.int64,
+        count=len(words),
+    )
 
 
 def embedding_to_json(embedding: np.ndarray) -> str:
@@ -142,48 +147,131 @@ def embedding_to_json(embedding: np.ndarray) -> str:
     return json.dumps(embedding.tolist())
 
 
+def embedding_to_base64(embedding: np.ndarray) -> str:
+    """
+    Convert numpy embedding array to a base64 string of its float32 bytes.
+
+    This is lossless and avoids formatting every float in Python, which
+    makes it much faster to write and about half the size of JSON.
+
+    Args:
+        embedding: Numpy array of embedding values
+
+    Returns:
+        Base64 (ASCII) encoding of the little-endian float32 bytes
+    """
+    return base64.b64encode(embedding.astype('<f4').tobytes()).decode('ascii')
+
+
+def decode_embedding(value: str) -> np.ndarray:
+    """
+    Decode an embedding written by either embedding_to_json or embedding_to_base64.
+
+    Args:
+        value: Encoded embedding string
+
+    Returns:
+        Numpy array of embedding values
+    """
+    if value.lstrip().startswith('['):
+        return np.asarray(json.loads(value), dtype=np.float32)
+    return np.frombuffer(base64.b64decode(value), dtype='<f4')
+
+
+def preview_embedding(value: str) -> tuple[list[float], int]:
+    """
+    Get the first three and last values of an encoded embedding, and its length.
+
+    JSON arrays are only split at the commas needed rather than parsed in
+    full; base64 embeddings are decoded without copying.
+
+    Args:
+        value: Encoded embedding string
+
+    Returns:
+        Tuple of ([first, second, third, last] values, embedding length)
+    """
+    value = value.strip()
+    if value.startswith('['):
+        items = value[1:-1]
+        head = items.split(',', 3)[:3]
+        tail = items.rsplit(',', 1)[-1]
+        return [float(x) for x in head + [tail]], items.count(',') + 1
+    embd = decode_embedding(value)
+    return [float(embd[0]), float(embd[1]), float(embd[2]), float(embd[-1])], len(embd)
+
+
+EMBEDDING_ENCODERS = {
+    "base64": embedding_to_base64,
+    "json": embedding_to_json,
+}
+
+
 def process_words_in_batches(
     df: pd.DataFrame,
     model: KeyedVectors,
-    batch_size: int = 1000
-) -> tuple[pd.DataFrame, dict]:
+    output_path: Path,
+    batch_size: int = 1000,
+    embedding_format: str = "base64"
+) -> dict:
     """
-    Process words in batches and generate embeddings.
+    Process words in batches, writing each embedded word to the output CSV.
+
+    Rows are written as they are embedded, so the encoded embeddings are
+    never all held in memory. Words without an embedding are left out.
 
     Args:
         df: DataFrame with words to process
         model: Loaded FastText model
+        output_path: Path to output CSV file
         batch_size: Number of words to process in each batch
+        embedding_format: Encoding of the embd column ("base64" or "json")
 
     Returns:
-        Tuple of (DataFrame with embeddings, statistics dict)
+        Statistics dict
     """
     print(f"\nGenerating embeddings...")
     print(f"Batch size: {batch_size}")
+    print(f"Embedding format: {embedding_format}")
+
+    encode_embedding = EMBEDDING_ENCODERS[embedding_format]
 
-    embeddings = []
     words_with_embeddings = 0
     words_skipped = 0
     skipped_words = []
 
-    # Process with progress bar
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Processing words"):
-        word = row["word"]
-        embedding = get_embedding(word, model)
+    # Ensure output directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    print(f"Saving results to: {output_path}")
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["word", "noun", "verb", "embd"])
 
-        if embedding is not None:
-            embeddings.append(embedding_to_json(embedding))
-            words_with_embeddings += 1
-        else:
-            embeddings.append(None)
-            words_skipped += 1
-            skipped_words.append(word)
+        # Iterate the column arrays directly; iterrows builds a Series per row
+        words = df["word"].to_numpy()
+        nouns = df["noun"].to_numpy()
+        verbs = df["verb"].to_numpy()
 
-    # Add embeddings column
-    df["embd"] = embeddings
+        # Process with progress bar
+        with tqdm(total=len(words), desc="Processing words") as progress:
+            for start in range(0, len(words), batch_size):
+                batch = slice(start, start + batch_size)
+                indices = lookup_vocab_indices(words[batch], model)
+                found = indices >= 0
 
-    # Remove rows without embeddings
-    df_with_embeddings = df.dropna(subset=["embd"]).copy()
+                # Gather the batch's embeddings with one fancy index
+                embeddings = iter(model.vectors[indices[found]])
+
+                for word, noun, verb, in_vocab in zip(words[batch], nouns[batch], verbs[batch], found):
+                    if in_vocab:
+                        writer.writerow([word, noun, verb, encode_embedding(next(embeddings))])
+                        words_with_embeddings += 1
+                    else:
+                        words_skipped += 1
+                        skipped_words.append(word)
+
+                progress.update(len(indices))
 
     # Collect statistics
     stats = {
@@ -194,28 +282,13 @@ def process_words_in_batches(
         "embedding_dimension": model.vector_size,
     }
 
-    return df_with_embeddings, stats
-
-
-def save_output(df: pd.DataFrame, output_path: Path) -> None:
-    """
-    Save DataFrame with embeddings to CSV file.
-
-    Args:
-        df: DataFrame with embeddings to save
-        output_path: Path to output CSV file
-    """
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    print(f"\nSaving results to: {output_path}")
-    df.to_csv(output_path, index=False)
-
     # Get file size
     file_size = output_path.stat().st_size
     file_size_mb = file_size / (1024 * 1024)
     print(f"Output file size: {file_size_mb:.2f} MB")
 
+    return stats
+
 
 def print_statistics(stats: dict) -> None:
     """
@@ -242,27 +315,30 @@ def print_statistics(stats: dict) -> None:
     print("=" * 60)
 
 
-def print_sample_rows(df: pd.DataFrame, n: int = 5) -> None:
+def print_sample_rows(output_path: Path, n: int = 5) -> None:
     """
-    Print sample rows from the output DataFrame.
+    Print sample rows from the output CSV file.
 
     Args:
-        df: DataFrame to sample from
+        output_path: Path to output CSV file
         n: Number of rows to display
     """
     print("\n" + "=" * 60)
     print(f"SAMPLE OUTPUT ROWS (first {n})")
     print("=" * 60)
 
-    for idx, row in df.head(n).iterrows():
+    with open(output_path, encoding="utf-8", newline="") as f:
+        rows = list(islice(csv.DictReader(f), n))
+
+    for row in rows:
         print(f"\nWord: {row['word']}")
         print(f"  Noun: {row['noun']}")
         print(f"  Verb: {row['verb']}")
 
-        # Parse embedding to show first few values
-        embd = json.loads(row['embd'])
-        print(f"  Embedding: [{embd[0]:.4f}, {embd[1]:.4f}, {embd[2]:.4f}, ..., {embd[-1]:.4f}]")
-        print(f"  Embedding length: {len(embd)}")
+        # Read just the values shown
+        values, length = preview_embedding(row['embd'])
+        print(f"  Embedding: [{values[0]:.4f}, {values[1]:.4f}, {values[2]:.4f}, ..., {values[3]:.4f}]")
+        print(f"  Embedding length: {length}")
 
     print("=" * 60)
 
@@ -318,6 +394,20 @@ Examples:
         help="Number of words to process at once (default: 1000)"
     )
 
+    parser.add_argument(
+        "--embedding-format",
+        choices=sorted(EMBEDDING_ENCODERS),
+        default="base64",
+        help="Encoding of the embd column: base64 float32 bytes or JSON arrays (default: base64)"
+    )
+
+    parser.add_argument(
+        "--no-model-cache",
+        action="store_false",
+        dest="use_model_cache",
+        help="Always parse the .vec file instead of using the memory-mapped .kv cache"
+    )
+
     return parser.parse_args()
 
 
@@ -335,24 +425,21 @@ def main() -> None:
 
     try:
         # Load FastText model
-        model = load_fasttext_model(args.model)
+        model = load_fasttext_model(args.model, args.use_model_cache)
 
         # Load classified words
         df = load_classified_words(args.input)
 
         # Process words and generate embeddings
-        df_with_embeddings, stats = process_words_in_batches(
-            df, model, args.batch_size
+        stats = process_words_in_batches(
+            df, model, args.output, args.batch_size, args.embedding_format
         )
 
-        # Save output
-        save_output(df_with_embeddings, args.output)
-
         # Print statistics
         print_statistics(stats)
 
         # Print sample rows
-        print_sample_rows(df_with_embeddings)
+        print_sample_rows(args.output)
 
         print("\n" + "=" * 60)
         print("COMPLETED SUCCESSFULLY!")